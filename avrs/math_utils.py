@@ -6,6 +6,7 @@ used by the routing decision function.
 """
 
 import math
+from operator import add, mul, sub
 from typing import List
 
 Vector = List[float]
@@ -15,12 +16,13 @@ def dot_product(v1: Vector, v2: Vector) -> float:
     """Compute the dot product of two vectors."""
     if len(v1) != len(v2):
         raise ValueError(f"Vector dimension mismatch: {len(v1)} vs {len(v2)}")
-    return sum(a * b for a, b in zip(v1, v2))
+    # map() with operator functions keeps the per-element loop in C
+    return sum(map(mul, v1, v2))
 
 
 def magnitude(v: Vector) -> float:
     """Compute the magnitude (L2 norm) of a vector."""
-    return math.sqrt(sum(x * x for x in v))
+    return math.hypot(*v)
 
 
 def cosine_similarity(v1: Vector, v2: Vector) -> float:
@@ -46,24 +48,28 @@ def euclidean_distance(v1: Vector, v2: Vector) -> float:
     Compute the Euclidean distance between two vectors.
 
     distance = sqrt( sum( (a_i - b_i)^2 ) )
+
+    Evaluated by math.dist in C: this is the per-hop routing kernel, and
+    for the small vectors used here it is several times faster than a
+    Python-level sum (or a NumPy call, whose overhead dominates at D=4).
     """
     if len(v1) != len(v2):
         raise ValueError(f"Vector dimension mismatch: {len(v1)} vs {len(v2)}")
-    return math.sqrt(sum((a - b) ** 2 for a, b in zip(v1, v2)))
+    return math.dist(v1, v2)
 
 
 def vector_subtract(v1: Vector, v2: Vector) -> Vector:
     """Compute v1 - v2 element-wise."""
     if len(v1) != len(v2):
         raise ValueError(f"Vector dimension mismatch: {len(v1)} vs {len(v2)}")
-    return [a - b for a, b in zip(v1, v2)]
+    return list(map(sub, v1, v2))
 
 
 def vector_add(v1: Vector, v2: Vector) -> Vector:
     """Compute v1 + v2 element-wise."""
     if len(v1) != len(v2):
         raise ValueError(f"Vector dimension mismatch: {len(v1)} vs {len(v2)}")
-    return [a + b for a, b in zip(v1, v2)]
+    return list(map(add, v1, v2))
 
 
 def normalize(v: Vector) -> Vector:
@@ -13,6 +13,7 @@ Why Delaunay?
 """
 
 import random
+from itertools import combinations
 from typing import List, Optional
 
 import numpy as np
@@ -111,14 +112,15 @@ class Network:
         points = np.array(vectors)
         tri = Delaunay(points)
 
-        # Extract unique edges from all simplices
-        edge_set = set()
-        for simplex in tri.simplices:
-            # A simplex in 4D has 5 vertices → 10 edges
-            for i in range(len(simplex)):
-                for j in range(i + 1, len(simplex)):
-                    a, b = simplex[i], simplex[j]
-                    edge_set.add((min(a, b), max(a, b)))
+        # Extract unique edges from all simplices in one vectorized pass
+        # (a simplex in 4D has 5 vertices → 10 edges)
+        pairs = np.array(list(combinations(range(tri.simplices.shape[1]), 2)))
+        edges = tri.simplices[:, pairs].reshape(-1, 2).astype(np.int64)
+        edges.sort(axis=1)
+        # Dedup on a scalar key (a*n+b), much faster than np.unique(axis=0)
+        n = len(points)
+        keys = np.unique(edges[:, 0] * n + edges[:, 1])
+        edge_set = zip((keys // n).tolist(), (keys % n).tolist())
 
         # Create bidirectional neighbor links
         for a_idx, b_idx in edge_set:
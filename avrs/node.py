@@ -9,10 +9,22 @@ SECTION 1 — NODE MODEL: Each node must contain:
 """
 
 from __future__ import annotations
-from typing import List, Optional, Dict, Any
+import struct
+import sys
+from typing import List, Optional, Dict, Any, Set, Hashable
 from avrs.math_utils import Vector
 
 
+def route_key(target: Vector) -> bytes:
+    """
+    Compact route-cache key for a target vector: coordinates rounded to
+    4 decimals and packed as float64 bytes. Same equality as a tuple of
+    the rounded floats (-0.0 is folded into 0.0), at a fraction of the
+    memory per entry.
+    """
+    return struct.pack(f"{len(target)}d", *[round(v, 4) + 0.0 for v in target])
+
+
 class Node:
     """
     A universal network node positioned in vector space.
@@ -32,6 +44,14 @@ class Node:
         overload_threshold: Maximum load before considered 'overloaded' (deprecated, use capacity).
     """
 
+    # Fixed attribute layout: no per-instance __dict__, so networks of
+    # many nodes are smaller and attribute access in routing loops is direct
+    __slots__ = (
+        "id", "url", "vector", "role", "neighbors", "_neighbor_ids", "_ids_for",
+        "load", "capacity", "trust", "latency", "alive", "overload_threshold",
+        "_route_cache",
+    )
+
     def __init__(
         self,
         node_id: str,
@@ -43,11 +63,17 @@ class Node:
         latency: float = 10.0,
         overload_threshold: Optional[float] = None,
     ):
-        self.id: str = node_id
+        # Interned so id comparisons in neighbor/visited sets short-circuit
+        # on identity even when the id string arrives from outside (JSON, API)
+        self.id: str = sys.intern(node_id)
         self.url: str = url or f"http://{node_id.lower()}:8080"
         self.vector: Vector = list(vector)  # Ensure list for consistency
         self.role: str = role
         self.neighbors: List[Node] = []
+        # Ids in self.neighbors, for O(1) duplicate checks; _ids_for is the
+        # list they were built from, so a reassigned list triggers a resync
+        self._neighbor_ids: Set[str] = set()
+        self._ids_for: List[Node] = self.neighbors
         self.load: float = 0.0
         self.capacity: float = capacity
         self.trust: float = max(0.0, min(1.0, trust))
@@ -56,8 +82,8 @@ class Node:
         # Backward compatibility
         self.overload_threshold: float = overload_threshold if overload_threshold is not None else capacity
 
-        # Optional route cache: maps a rounded target vector tuple → next-hop node id
-        self._route_cache: Dict[tuple, str] = {}
+        # Optional route cache: maps route_key(target) → next-hop node id
+        self._route_cache: Dict[Hashable, str] = {}
 
     # ── State Management ──────────────────────────────────────────
 
@@ -103,14 +129,30 @@ class Node:
 
     # ── Neighbor Management ───────────────────────────────────────
 
+    def _neighbor_id_set(self) -> Set[str]:
+        if self._ids_for is not self.neighbors:
+            self._neighbor_ids = {n.id for n in self.neighbors}
+            self._ids_for = self.neighbors
+        return self._neighbor_ids
+
     def add_neighbor(self, neighbor: Node) -> None:
         """Add a bidirectional neighbor link (if not already present)."""
-        if neighbor not in self.neighbors and neighbor.id != self.id:
+        ids = self._neighbor_id_set()
+        if neighbor.id not in ids and neighbor.id != self.id:
             self.neighbors.append(neighbor)
+            ids.add(neighbor.id)
 
     def remove_neighbor(self, neighbor: Node) -> None:
         """Remove a neighbor link."""
         self.neighbors = [n for n in self.neighbors if n.id != neighbor.id]
+        self._neighbor_ids = {n.id for n in self.neighbors}
+        self._ids_for = self.neighbors
+
+    def clear_neighbors(self) -> None:
+        """Drop all neighbor links."""
+        self.neighbors = []
+        self._neighbor_ids = set()
+        self._ids_for = self.neighbors
 
     def get_alive_neighbors(self) -> List[Node]:
         """Return only neighbors that are currently alive."""
@@ -118,11 +160,11 @@ class Node:
 
     # ── Route Cache (Optional Optimization, Section 13) ───────────
 
-    def cache_route(self, target_key: tuple, next_hop_id: str) -> None:
+    def cache_route(self, target_key: Hashable, next_hop_id: str) -> None:
         """Cache a successful next-hop for a target vector key."""
         self._route_cache[target_key] = next_hop_id
 
-    def get_cached_route(self, target_key: tuple) -> Optional[str]:
+    def get_cached_route(self, target_key: Hashable) -> Optional[str]:
         """Retrieve a cached next-hop, or None."""
         return self._route_cache.get(target_key)
 
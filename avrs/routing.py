@@ -13,7 +13,7 @@ Before scoring, router must discard nodes where load ≥ capacity.
 
 from typing import Optional, List, Tuple
 
-from avrs.node import Node
+from avrs.node import Node, route_key
 from avrs.math_utils import (
     Vector,
     cosine_similarity,
@@ -182,7 +182,7 @@ class RoutingEngine:
         
         # Check cache first
         if self.use_cache:
-            target_key = tuple(round(v, 4) for v in target)
+            target_key = route_key(target)
             cached_id = current.get_cached_route(target_key)
             if cached_id is not None:
                 # Validate cached node is still alive, a neighbor, and below capacity
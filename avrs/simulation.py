@@ -9,7 +9,7 @@ import uuid
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-from avrs.node import Node
+from avrs.node import Node, route_key
 from avrs.network import Network
 from avrs.routing import RoutingEngine
 from avrs.math_utils import Vector, euclidean_distance
@@ -297,7 +297,7 @@ class Simulation:
             result.hops.append(hop)
 
             # Cache route
-            target_key = tuple(round(v, 4) for v in target)
+            target_key = route_key(target)
             current.cache_route(target_key, next_node.id)
 
             # Record hop latency
@@ -12,9 +12,14 @@ Similarity metric must be cosine similarity.
 import hashlib
 import math
 from typing import List, Dict
+import numpy as np
 from avrs.math_utils import Vector, cosine_similarity
 
 
+# int8 quantization range: each row is scaled so its largest |component| maps to 127
+INT8_SCALE = 127
+
+
 class VectorEmbedder:
     """
     Generates semantic embeddings for nodes and requests.
@@ -55,22 +60,18 @@ class VectorEmbedder:
         hash_obj = hashlib.sha256(text.encode())
         hash_bytes = hash_obj.digest()
         
-        # Convert hash bytes to float vector
-        vector = []
-        for i in range(self.dimensions):
-            # Use multiple bytes to create smooth distribution
-            byte_idx = i % len(hash_bytes)
-            byte_val = hash_bytes[byte_idx]
-            # Normalize to [-1, 1] range
-            normalized = (byte_val / 255.0) * 2.0 - 1.0
-            vector.append(normalized)
+        # Expand the digest to the target dimension by repeating it
+        raw = np.frombuffer(hash_bytes, dtype=np.uint8)
+        tiled = np.tile(raw, -(-self.dimensions // raw.size))[:self.dimensions]
+        # Normalize to [-1, 1] range
+        vector = tiled / 255.0 * 2.0 - 1.0
         
         # Normalize vector to unit length for cosine similarity
-        magnitude = math.sqrt(sum(x * x for x in vector))
+        magnitude = np.sqrt(vector @ vector)
         if magnitude > 0:
-            vector = [x / magnitude for x in vector]
+            vector = vector / magnitude
         
-        return vector
+        return vector.tolist()
     
     def embed_service_description(self, role: str, description: str = "") -> Vector:
         """
@@ -133,6 +134,49 @@ class VectorEmbedder:
         """
         return cosine_similarity(node_vector, request_vector)
 
+    def quantize(self, vectors) -> np.ndarray:
+        """
+        Quantize one vector or a batch of vectors to int8.
+
+        Each row is scaled independently by its max-abs component, which
+        cosine similarity is invariant to, so no scale needs to be kept.
+
+        Args:
+            vectors: A single vector or a list of vectors
+
+        Returns:
+            int8 array of the same shape
+        """
+        arr = np.asarray(vectors, dtype=np.float32)
+        peak = np.abs(arr).max(axis=-1, keepdims=True)
+        peak[peak == 0] = 1.0
+        return np.rint(arr / peak * INT8_SCALE).astype(np.int8)
+
+    def compute_similarity_batch(self, node_vectors, request_vector: Vector) -> np.ndarray:
+        """
+        Approximate cosine similarity of many node vectors against one request.
+
+        Node vectors may be passed pre-quantized (int8 from quantize()) so
+        that repeated scoring moves a quarter of the bytes of float32.
+        The request vector is quantized on the fly.
+
+        Args:
+            node_vectors: (N, D) vectors, float or int8
+            request_vector: The request's target vector
+
+        Returns:
+            float array of N cosine similarities in [-1, 1]
+        """
+        q_nodes = np.asarray(node_vectors)
+        if q_nodes.dtype != np.int8:
+            q_nodes = self.quantize(q_nodes)
+        q_nodes = q_nodes.astype(np.int32)
+        q_req = self.quantize(request_vector).astype(np.int32)
+
+        dots = q_nodes @ q_req
+        norms = np.sqrt((q_nodes * q_nodes).sum(axis=1) * float(q_req @ q_req))
+        return np.divide(dots, norms, out=np.zeros(len(dots)), where=norms > 0)
+
 
 # Global embedder instance (defaults to 4D to match network)
 _default_embedder = VectorEmbedder(dimensions=4)
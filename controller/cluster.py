@@ -9,32 +9,56 @@ No real cluster is required — all state is held in memory.
 """
 
 import time
-import uuid
+import queue
+import heapq
 import random
+import itertools
 import threading
+import numpy as np
 import copy
-from typing import List, Dict, Optional, Any
-from enum import Enum
-from collections import defaultdict
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, Callable, Mapping, Tuple, Deque
+from enum import Enum, IntEnum
+from collections import defaultdict, deque
 
 
 # ═══════════════════════════════════════════════════════════════════
 #  ENUMS — Status types for all K8s primitives
 # ═══════════════════════════════════════════════════════════════════
 
-class NodeStatus(Enum):
-    READY = "Ready"
-    NOT_READY = "NotReady"
-    DRAINING = "Draining"
+class NodeStatus(IntEnum):
+    READY = 0
+    NOT_READY = 1
+    DRAINING = 2
+
+    @property
+    def label(self) -> str:
+        """Kubernetes display string, e.g. "NotReady"."""
+        return _NODE_STATUS_LABELS[self]
+
+
+class PodStatus(IntEnum):
+    RUNNING = 0
+    PENDING = 1
+    CRASH_LOOP = 2
+    FAILED = 3
+    TERMINATING = 4
+    SUCCEEDED = 5
+
+    @property
+    def label(self) -> str:
+        """Kubernetes display string, e.g. "CrashLoopBackOff"."""
+        return _POD_STATUS_LABELS[self]
 
 
-class PodStatus(Enum):
-    RUNNING = "Running"
-    PENDING = "Pending"
-    CRASH_LOOP = "CrashLoopBackOff"
-    FAILED = "Failed"
-    TERMINATING = "Terminating"
-    SUCCEEDED = "Succeeded"
+# Indexed by the integer status value
+_NODE_STATUS_LABELS = ("Ready", "NotReady", "Draining")
+_POD_STATUS_LABELS = (
+    "Running", "Pending", "CrashLoopBackOff", "Failed", "Terminating", "Succeeded",
+)
+
+# Pod states that need recovery
+POD_FAILED_STATES = frozenset({PodStatus.FAILED, PodStatus.CRASH_LOOP})
 
 
 class ServiceType(Enum):
@@ -43,6 +67,42 @@ class ServiceType(Enum):
     LOAD_BALANCER = "LoadBalancer"
 
 
+# ═══════════════════════════════════════════════════════════════════
+#  UIDS — Process-unique 8-char hex ids
+# ═══════════════════════════════════════════════════════════════════
+
+_uid_counter = itertools.count()
+
+
+def _next_uid() -> str:
+    return format(next(_uid_counter), "08x")
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  LABEL INTERNING — Identical label sets share one read-only mapping
+# ═══════════════════════════════════════════════════════════════════
+
+# Bounded: once full, the oldest label set is evicted. Pods already
+# holding an evicted mapping keep it; only future sharing is lost.
+_LABEL_POOL_MAX = 4096
+_label_pool: Dict[frozenset, Mapping[str, str]] = {}
+_label_pool_lock = threading.Lock()
+
+
+def _intern_labels(labels: Mapping[str, str]) -> Mapping[str, str]:
+    """Return the pooled read-only view for a label set."""
+    key = frozenset(labels.items())
+    view = _label_pool.get(key)
+    if view is None:
+        with _label_pool_lock:
+            view = _label_pool.get(key)
+            if view is None:
+                if len(_label_pool) >= _LABEL_POOL_MAX:
+                    del _label_pool[next(iter(_label_pool))]
+                view = _label_pool[key] = MappingProxyType(dict(labels))
+    return view
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  POD — The smallest deployable unit
 # ═══════════════════════════════════════════════════════════════════
@@ -50,37 +110,119 @@ class ServiceType(Enum):
 class Pod:
     """Simulated Kubernetes Pod."""
 
+    __slots__ = (
+        "name", "uid", "image", "labels", "node_name", "_status",
+        "restart_count", "created_at", "last_health_check", "health_ok",
+        "_latency_ms", "cpu_usage", "memory_mb", "deployment_name",
+        "_static_dict", "_on_change", "_table", "_row",
+    )
+
+    # Uniform ranges for simulated metrics
+    LATENCY_RANGE = (5.0, 50.0)
+    SPIKE_LATENCY_RANGE = (5.0, 80.0)
+    CPU_RANGE = (0.05, 0.3)
+    MEMORY_RANGE = (64.0, 256.0)
+
     def __init__(
         self,
         name: str,
         image: str = "app:latest",
-        labels: Optional[Dict[str, str]] = None,
+        labels: Optional[Mapping[str, str]] = None,
         node_name: Optional[str] = None,
+        latency_ms: Optional[float] = None,
+        cpu_usage: Optional[float] = None,
+        memory_mb: Optional[float] = None,
     ):
+        # Column-store row, set by PodTable.add; status/latency write through
+        self._table: Optional["PodTable"] = None
+        self._row = -1
         self.name = name
-        self.uid = str(uuid.uuid4())[:8]
+        self.uid = _next_uid()
         self.image = image
-        self.labels = labels or {}
+        # Shared read-only view; pods with the same labels reference one dict
+        self.labels = _intern_labels(labels or {})
         self.node_name = node_name
         self.status = PodStatus.PENDING
         self.restart_count = 0
         self.created_at = time.time()
         self.last_health_check = 0.0
         self.health_ok = True
-        self.latency_ms = random.uniform(5.0, 50.0)
-        self.cpu_usage = random.uniform(0.05, 0.3)
-        self.memory_mb = random.uniform(64, 256)
+        # Pre-drawn metrics (see Deployment._seed_pods) skip the per-pod RNG calls
+        self.latency_ms = latency_ms if latency_ms is not None else random.uniform(*self.LATENCY_RANGE)
+        self.cpu_usage = cpu_usage if cpu_usage is not None else random.uniform(*self.CPU_RANGE)
+        self.memory_mb = memory_mb if memory_mb is not None else random.uniform(*self.MEMORY_RANGE)
         self.deployment_name: Optional[str] = None
+        # Identity fields never change after creation — serialize them once
+        self._static_dict = {
+            "name": self.name,
+            "uid": self.uid,
+            "image": self.image,
+            "created_at": self.created_at,
+        }
+        # Set by the owning Cluster so watchers see status/latency changes
+        self._on_change: Optional[Callable[["Pod"], None]] = None
+
+    def _changed(self):
+        """Notify the owning cluster that status or health changed."""
+        if self._on_change is not None:
+            self._on_change(self)
 
-    def check_health(self) -> bool:
-        """Simulate a /health endpoint check."""
+    @property
+    def status(self) -> PodStatus:
+        return self._status
+
+    @status.setter
+    def status(self, value: PodStatus):
+        self._status = value
+        if self._table is not None:
+            self._table.status[self._row] = value
+
+    @property
+    def latency_ms(self) -> float:
+        return self._latency_ms
+
+    @latency_ms.setter
+    def latency_ms(self, value: float):
+        table = self._table
+        if table is None:
+            self._latency_ms = value
+            return
+        old = self._latency_ms
+        self._latency_ms = value
+        table.latency[self._row] = value
+        # Watchers only hear about crossings of a threshold they registered
+        for threshold in table.latency_watch:
+            if (old > threshold) != (value > threshold):
+                self._changed()
+                break
+
+    def set_label(self, key: str, value: str):
+        """Change one label, moving this pod onto a different shared label set."""
+        self.labels = _intern_labels({**self.labels, key: value})
+        # Which services select this pod may have changed
+        if self._table is not None:
+            self._table.touch()
+        self._changed()
+
+    def check_health(self, latency_ms: Optional[float] = None) -> bool:
+        """
+        Simulate a /health endpoint check, optionally with a pre-drawn latency.
+
+        Watchers are notified only when health flips or the redrawn
+        latency crosses a watched threshold (see Cluster.watch_latency).
+        """
         self.last_health_check = time.time()
+        was_ok = self.health_ok
         if self.status != PodStatus.RUNNING:
             self.health_ok = False
+            if was_ok:
+                self._changed()
             return False
         # Simulate occasional latency spikes
-        self.latency_ms = random.uniform(5.0, 80.0)
+        self.latency_ms = latency_ms if latency_ms is not None else random.uniform(*self.SPIKE_LATENCY_RANGE)
         self.health_ok = True
+        if not was_ok:
+            self._changed()
         return True
 
     def crash(self):
@@ -88,41 +230,108 @@ class Pod:
         self.status = PodStatus.CRASH_LOOP
         self.health_ok = False
         self.restart_count += 1
+        self._changed()
 
     def fail(self):
         """Simulate permanent pod failure."""
         self.status = PodStatus.FAILED
         self.health_ok = False
+        self._changed()
 
     def start(self):
         """Start or restart the pod."""
         self.status = PodStatus.RUNNING
         self.health_ok = True
-        self.latency_ms = random.uniform(5.0, 50.0)
+        self.latency_ms = random.uniform(*self.LATENCY_RANGE)
+        self._changed()
 
     def terminate(self):
         """Graceful termination."""
         self.status = PodStatus.TERMINATING
         self.health_ok = False
+        self._changed()
 
     def to_dict(self) -> dict:
         return {
-            "name": self.name,
-            "uid": self.uid,
-            "image": self.image,
-            "labels": self.labels,
+            **self._static_dict,
+            # A fresh dict: the pooled mapping is shared by every pod with these labels
+            "labels": dict(self.labels),
             "node_name": self.node_name,
-            "status": self.status.value,
+            "status": self.status.label,
             "restart_count": self.restart_count,
             "health_ok": self.health_ok,
             "latency_ms": round(self.latency_ms, 1),
             "cpu_usage": round(self.cpu_usage, 3),
             "memory_mb": round(self.memory_mb, 1),
             "deployment": self.deployment_name,
-            "created_at": self.created_at,
         }
 
 
+# ═══════════════════════════════════════════════════════════════════
+#  POD TABLE — Column store of pod status and latency
+# ═══════════════════════════════════════════════════════════════════
+
+class PodTable:
+    """
+    Structure-of-arrays view of a cluster's pods for vectorized scans.
+
+    Each registered pod owns one row; its status and latency setters
+    write through, so the arrays never need rebuilding. Free rows hold
+    status EMPTY and never match any PodStatus. `version` moves on every
+    add/remove and relabel, so caches keyed on pod membership (or on
+    which pods a selector matches) can tell they're stale.
+    `latency_watch` holds the thresholds (see Cluster.watch_latency)
+    whose crossing makes a pod notify its cluster.
+    """
+
+    EMPTY = -1
+
+    def __init__(self, capacity: int = 64):
+        self.status = np.full(capacity, self.EMPTY, dtype=np.int8)
+        self.latency = np.zeros(capacity, dtype=np.float64)
+        self.pods: List[Optional[Pod]] = [None] * capacity
+        self._free = list(range(capacity - 1, -1, -1))
+        self._lock = threading.Lock()
+        self.version = 0
+        self.latency_watch: Tuple[float, ...] = ()
+
+    def add(self, pod: Pod):
+        if pod._table is self:
+            return
+        with self._lock:
+            if not self._free:
+                self._grow()
+            row = self._free.pop()
+            self.pods[row] = pod
+            pod._table, pod._row = self, row
+            self.status[row] = pod.status
+            self.latency[row] = pod.latency_ms
+            self.version += 1
+
+    def remove(self, pod: Pod):
+        if pod._table is not self:
+            return
+        with self._lock:
+            row = pod._row
+            pod._table, pod._row = None, -1
+            self.pods[row] = None
+            self.status[row] = self.EMPTY
+            self._free.append(row)
+            self.version += 1
+
+    def touch(self):
+        """Bump the version without changing rows (e.g. a pod was relabeled)."""
+        with self._lock:
+            self.version += 1
+
+    def _grow(self):
+        old = len(self.pods)
+        self.status = np.concatenate([self.status, np.full(old, self.EMPTY, dtype=np.int8)])
+        self.latency = np.concatenate([self.latency, np.zeros(old)])
+        self.pods.extend([None] * old)
+        self._free.extend(range(2 * old - 1, old - 1, -1))
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  KUBE NODE — A worker machine in the cluster
 # ═══════════════════════════════════════════════════════════════════
@@ -130,6 +339,12 @@ class Pod:
 class KubeNode:
     """Simulated Kubernetes Worker Node."""
 
+    __slots__ = (
+        "name", "uid", "status", "cpu_cores", "memory_gb", "max_pods",
+        "pods", "created_at", "conditions", "_static_dict",
+        "_on_change", "_heap_order", "_heap_version",
+    )
+
     def __init__(
         self,
         name: str,
@@ -138,7 +353,7 @@ class KubeNode:
         max_pods: int = 30,
     ):
         self.name = name
-        self.uid = str(uuid.uuid4())[:8]
+        self.uid = _next_uid()
         self.status = NodeStatus.READY
         self.cpu_cores = cpu_cores
         self.memory_gb = memory_gb
@@ -151,6 +366,23 @@ class KubeNode:
             "DiskPressure": False,
             "PIDPressure": False,
         }
+        # Capacity and identity are fixed for the node's lifetime
+        self._static_dict = {
+            "name": self.name,
+            "uid": self.uid,
+            "cpu_cores": self.cpu_cores,
+            "memory_gb": round(self.memory_gb, 2),
+            "max_pods": self.max_pods,
+        }
+        # Scheduler heap bookkeeping, managed by the owning Cluster
+        self._on_change: Optional[Callable[["KubeNode"], None]] = None
+        self._heap_order = 0
+        self._heap_version = 0
+
+    def _changed(self):
+        """Notify the owning cluster that load or status changed."""
+        if self._on_change is not None:
+            self._on_change(self)
 
     @property
     def pod_count(self) -> int:
@@ -177,12 +409,15 @@ class KubeNode:
         pod.status = PodStatus.RUNNING
         pod.health_ok = True
         self.pods.append(pod)
+        pod._changed()
+        self._changed()
 
     def remove_pod(self, pod_name: str) -> Optional[Pod]:
         for i, p in enumerate(self.pods):
             if p.name == pod_name:
                 removed = self.pods.pop(i)
                 removed.node_name = None
+                self._changed()
                 return removed
         return None
 
@@ -194,11 +429,13 @@ class KubeNode:
         for pod in self.pods:
             pod.health_ok = False
             pod.status = PodStatus.FAILED
+        self._changed()
 
     def mark_ready(self):
         """Recover the node."""
         self.status = NodeStatus.READY
         self.conditions["Ready"] = True
+        self._changed()
 
     def drain(self):
         """Drain a node — mark pods for eviction."""
@@ -206,18 +443,15 @@ class KubeNode:
         for pod in self.pods:
             pod.status = PodStatus.TERMINATING
             pod.health_ok = False
+        self._changed()
 
     def to_dict(self) -> dict:
         return {
-            "name": self.name,
-            "uid": self.uid,
-            "status": self.status.value,
-            "cpu_cores": self.cpu_cores,
+            **self._static_dict,
+            "status": self.status.label,
             "cpu_used": round(self.cpu_used, 2),
-            "memory_gb": round(self.memory_gb, 2),
             "memory_used_gb": round(self.memory_used, 2),
             "pod_count": self.pod_count,
-            "max_pods": self.max_pods,
             "conditions": self.conditions,
             "pods": [p.name for p in self.pods],
         }
@@ -230,6 +464,10 @@ class KubeNode:
 class Deployment:
     """Simulated Kubernetes Deployment."""
 
+    __slots__ = (
+        "name", "uid", "image", "replicas_desired", "labels", "pods", "created_at",
+    )
+
     def __init__(
         self,
         name: str,
@@ -238,7 +476,7 @@ class Deployment:
         labels: Optional[Dict[str, str]] = None,
     ):
         self.name = name
-        self.uid = str(uuid.uuid4())[:8]
+        self.uid = _next_uid()
         self.image = image
         self.replicas_desired = replicas
         self.labels = labels or {"app": name}
@@ -253,12 +491,35 @@ class Deployment:
     def replicas_available(self) -> int:
         return sum(1 for p in self.pods if p.status == PodStatus.RUNNING)
 
-    def create_pod(self, index: int) -> Pod:
+    def _seed_pods(self, n: int, rng: Optional[np.random.Generator] = None) -> tuple:
+        """
+        Draw latency, CPU and memory for n pods in one vectorized batch.
+        Without an explicit generator one is seeded from the `random`
+        module, so random.seed() still makes runs reproducible.
+        """
+        if rng is None:
+            rng = np.random.default_rng(random.getrandbits(64))
+        return (
+            rng.uniform(*Pod.LATENCY_RANGE, size=n).tolist(),
+            rng.uniform(*Pod.CPU_RANGE, size=n).tolist(),
+            rng.uniform(*Pod.MEMORY_RANGE, size=n).tolist(),
+        )
+
+    def create_pod(
+        self,
+        index: int,
+        latency_ms: Optional[float] = None,
+        cpu_usage: Optional[float] = None,
+        memory_mb: Optional[float] = None,
+    ) -> Pod:
         """Create a new pod for this deployment."""
         pod = Pod(
             name=f"{self.name}-pod-{index}",
             image=self.image,
-            labels=dict(self.labels),
+            labels=self.labels,
+            latency_ms=latency_ms,
+            cpu_usage=cpu_usage,
+            memory_mb=memory_mb,
         )
         pod.deployment_name = self.name
         self.pods.append(pod)
@@ -267,7 +528,7 @@ class Deployment:
     def get_failed_pods(self) -> List[Pod]:
         return [
             p for p in self.pods
-            if p.status in (PodStatus.FAILED, PodStatus.CRASH_LOOP)
+            if p.status in POD_FAILED_STATES
         ]
 
     def get_running_pods(self) -> List[Pod]:
@@ -293,6 +554,8 @@ class Deployment:
 class Service:
     """Simulated Kubernetes Service."""
 
+    __slots__ = ("name", "uid", "selector", "port", "service_type", "_rr_index")
+
     def __init__(
         self,
         name: str,
@@ -301,12 +564,16 @@ class Service:
         service_type: ServiceType = ServiceType.CLUSTER_IP,
     ):
         self.name = name
-        self.uid = str(uuid.uuid4())[:8]
+        self.uid = _next_uid()
         self.selector = selector or {}
         self.port = port
         self.service_type = service_type
         self._rr_index = 0  # round-robin counter
 
+    def selects(self, pod: Pod) -> bool:
+        """Whether the pod's labels match this service's selector."""
+        return all(pod.labels.get(k) == v for k, v in self.selector.items())
+
     def get_healthy_endpoints(self, all_pods: List[Pod]) -> List[Pod]:
         """Find all healthy pods matching this service's selector."""
         endpoints = []
@@ -314,8 +581,7 @@ class Service:
             if pod.status != PodStatus.RUNNING or not pod.health_ok:
                 continue
             # Check label selector match
-            match = all(pod.labels.get(k) == v for k, v in self.selector.items())
-            if match:
+            if self.selects(pod):
                 endpoints.append(pod)
         return endpoints
 
@@ -353,21 +619,58 @@ class Cluster:
     Provides scheduling, event logging, and state serialization.
     """
 
-    def __init__(self, name: str = "k8s-cluster"):
+    def __init__(self, name: str = "k8s-cluster", seed: Optional[int] = None):
         self.name = name
         self.nodes: List[KubeNode] = []
         self.deployments: List[Deployment] = []
         self.services: List[Service] = []
-        self.event_log: List[Dict[str, Any]] = []
-        self._lock = threading.Lock()
+        self.event_log: Deque[Dict[str, Any]] = deque(maxlen=500)
+        # _log_event only enqueues; readers fold the queue into event_log
+        self._log_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=10_000)
+        self._log_drain_lock = threading.Lock()
+        self.dropped_events = 0
+        # Reentrant: node callbacks re-push the scheduler heap both from
+        # inside schedule_pod (lock held) and from bare node state changes
+        self._lock = threading.RLock()
         self.created_at = time.time()
+        # Pod metric draws; None falls back to the `random` module's state
+        self._rng: Optional[np.random.Generator] = (
+            np.random.default_rng(seed) if seed is not None else None
+        )
+        # Min-heap of (pod_count, join_order, version, node). An entry is
+        # stale once the node's version moves on; stale entries are dropped
+        # lazily when popped.
+        self._node_heap: List[tuple] = []
+        self._node_order = itertools.count()
+        self.pod_table = PodTable()
+        # Change watchers, replaced (never mutated) so dispatch needs no lock
+        self._subscribers: Tuple[Callable[[str, Any], None], ...] = ()
 
     # ── Node Management ──────────────────────────────────────────
 
     def add_node(self, node: KubeNode):
         with self._lock:
             self.nodes.append(node)
+            for pod in node.pods:
+                self.pod_table.add(pod)
+            node._heap_order = next(self._node_order)
+            node._on_change = self._node_changed
+            self._push_node(node)
             self._log_event("NodeAdded", f"Node '{node.name}' joined the cluster")
+        self._notify("Node", node)
+
+    def clear(self):
+        """Remove all nodes, deployments, and services."""
+        with self._lock:
+            for node in self.nodes:
+                node._on_change = None
+            self.nodes.clear()
+            self.deployments.clear()
+            self.services.clear()
+            self._node_heap.clear()
+            watch = self.pod_table.latency_watch
+            self.pod_table = PodTable()
+            self.pod_table.latency_watch = watch
 
     def get_node(self, name: str) -> Optional[KubeNode]:
         for n in self.nodes:
@@ -378,21 +681,101 @@ class Cluster:
     def get_ready_nodes(self) -> List[KubeNode]:
         return [n for n in self.nodes if n.status == NodeStatus.READY]
 
+    # ── Change Notifications ─────────────────────────────────────
+
+    def subscribe(self, callback: Callable[[str, Any], None]):
+        """
+        Register callback(resource_type, resource), fired whenever a
+        "Node", "Pod", or "Service" is added or changes state.
+        """
+        self._subscribers = self._subscribers + (callback,)
+
+    def unsubscribe(self, callback: Callable[[str, Any], None]):
+        self._subscribers = tuple(cb for cb in self._subscribers if cb != callback)
+
+    def watch_latency(self, threshold_ms: float):
+        """
+        Also notify for a pod whenever its latency crosses threshold_ms in
+        either direction; plain latency redraws stay silent otherwise.
+        """
+        with self._lock:
+            table = self.pod_table
+            table.latency_watch = table.latency_watch + (threshold_ms,)
+
+    def unwatch_latency(self, threshold_ms: float):
+        """Drop one registration made by watch_latency()."""
+        with self._lock:
+            table = self.pod_table
+            watch = list(table.latency_watch)
+            if threshold_ms in watch:
+                watch.remove(threshold_ms)
+            table.latency_watch = tuple(watch)
+
+    def _notify(self, resource_type: str, resource: Any):
+        for cb in self._subscribers:
+            cb(resource_type, resource)
+
+    def _node_changed(self, node: KubeNode):
+        self._push_node(node)
+        self._notify("Node", node)
+
+    def _pod_changed(self, pod: Pod):
+        self._notify("Pod", pod)
+
     # ── Pod Scheduling ───────────────────────────────────────────
 
+    def _push_node(self, node: KubeNode):
+        """(Re)insert a node into the scheduler heap with its current load."""
+        with self._lock:
+            node._heap_version += 1
+            heapq.heappush(
+                self._node_heap,
+                (node.pod_count, node._heap_order, node._heap_version, node),
+            )
+            # Compact once stale entries dominate
+            if len(self._node_heap) > 4 * len(self.nodes) + 16:
+                self._node_heap = [e for e in self._node_heap if e[2] == e[3]._heap_version]
+                heapq.heapify(self._node_heap)
+
     def schedule_pod(self, pod: Pod) -> Optional[KubeNode]:
         """Schedule a pod onto the least-loaded ready node."""
+        self.pod_table.add(pod)
         with self._lock:
-            candidates = [n for n in self.nodes if n.can_schedule()]
-            if not candidates:
+            # Least-loaded scheduling: pop until a schedulable node surfaces
+            target = None
+            skipped = []
+            while self._node_heap:
+                entry = heapq.heappop(self._node_heap)
+                node = entry[3]
+                if entry[2] != node._heap_version:
+                    continue
+                if node.can_schedule():
+                    target = node
+                    break
+                skipped.append(entry)
+            for entry in skipped:
+                heapq.heappush(self._node_heap, entry)
+            if target is None:
                 self._log_event("ScheduleFailed", f"No node available for pod '{pod.name}'")
                 return None
-            # Least-loaded scheduling
-            target = min(candidates, key=lambda n: n.pod_count)
+            # add_pod re-pushes the target with its new pod count
+            pod._on_change = self._pod_changed
             target.add_pod(pod)
             self._log_event("PodScheduled", f"Pod '{pod.name}' → Node '{target.name}'")
             return target
 
+    def delete_pod(self, pod: Pod):
+        """Remove a pod from its node, its deployment, and the pod table."""
+        if pod.node_name:
+            node = self.get_node(pod.node_name)
+            if node:
+                node.remove_pod(pod.name)
+        dep = self.get_deployment(pod.deployment_name) if pod.deployment_name else None
+        if dep:
+            dep.pods = [p for p in dep.pods if p is not pod]
+        self.pod_table.remove(pod)
+        self._notify("Pod", pod)
+
     def all_pods(self) -> List[Pod]:
         """Get all pods across all nodes."""
         pods = []
@@ -413,8 +796,11 @@ class Cluster:
         with self._lock:
             self.deployments.append(deployment)
             scheduled = []
+            latencies, cpus, mems = deployment._seed_pods(deployment.replicas_desired, self._rng)
             for i in range(deployment.replicas_desired):
-                pod = deployment.create_pod(i)
+                pod = deployment.create_pod(i, latencies[i], cpus[i], mems[i])
+                pod._on_change = self._pod_changed
+                self.pod_table.add(pod)
                 self._log_event("PodCreated", f"Pod '{pod.name}' created by deployment '{deployment.name}'")
                 scheduled.append(pod)
             self._log_event("DeploymentCreated", f"Deployment '{deployment.name}' with {deployment.replicas_desired} replicas")
@@ -440,6 +826,7 @@ class Cluster:
                 "ServiceCreated",
                 f"Service '{service.name}' created with {len(endpoints)} endpoints"
             )
+        self._notify("Service", service)
 
     def get_service(self, name: str) -> Optional[Service]:
         for s in self.services:
@@ -450,19 +837,41 @@ class Cluster:
     # ── Event Log ────────────────────────────────────────────────
 
     def _log_event(self, kind: str, message: str, severity: str = "Normal"):
+        """Record an event without ever blocking the caller."""
         event = {
             "timestamp": time.time(),
             "kind": kind,
             "message": message,
             "severity": severity,
         }
-        self.event_log.append(event)
-        # Keep last 500 events
-        if len(self.event_log) > 500:
-            self.event_log = self.event_log[-500:]
+        try:
+            self._log_queue.put_nowait(event)
+        except queue.Full:
+            # Nobody has read in a while: fold the backlog in, unless a
+            # reader is already doing so, in which case drop this entry
+            try:
+                if not self._drain_log_queue(blocking=False):
+                    raise queue.Full
+                self._log_queue.put_nowait(event)
+            except queue.Full:
+                self.dropped_events += 1
+
+    def _drain_log_queue(self, blocking: bool = True) -> bool:
+        """Move queued events into event_log. Returns False if the drain lock was busy."""
+        if not self._log_drain_lock.acquire(blocking):
+            return False
+        try:
+            while True:
+                try:
+                    self.event_log.append(self._log_queue.get_nowait())
+                except queue.Empty:
+                    return True
+        finally:
+            self._log_drain_lock.release()
 
     def get_recent_events(self, count: int = 50) -> List[Dict]:
-        return list(reversed(self.event_log[-count:]))
+        self._drain_log_queue()
+        return list(itertools.islice(reversed(self.event_log), count))
 
     # ── Serialization ────────────────────────────────────────────
 
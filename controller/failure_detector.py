@@ -9,19 +9,68 @@ Detects:
   • Service unreachable (no healthy endpoints)
   • Node NotReady
   • Latency > threshold
+
+The background thread is event-driven: it consumes the cluster's change
+notifications and re-checks only the resource that changed. A full
+detect_all() runs only every check_interval seconds (60 by default) as a
+safety net against a missed notification. Notifications queued while the
+thread was busy are merged and handled as one batch. Services are
+re-checked only when a pod leaves the healthy set, against an index of
+healthy pods that is updated in place per event and rebuilt by each
+reconcile pass. The detector registers its latency threshold with the
+cluster, so a probe that pushes a pod across it raises a notification too.
 """
 
 import time
+import queue
 import threading
-from typing import List, Dict, Optional, Callable, Any
+from collections import Counter, deque, defaultdict
+from typing import List, Dict, Optional, Callable, Any, Tuple, Deque, Mapping
+import numpy as np
 from controller.cluster import (
     Cluster, KubeNode, Pod, Deployment, Service,
-    NodeStatus, PodStatus,
+    NodeStatus, PodStatus, POD_FAILED_STATES,
 )
 
 
+# Severity of a PodFailure by pod status
+SEV_BY_STATUS = {PodStatus.CRASH_LOOP: "Warning", PodStatus.FAILED: "Critical"}
+
+# Wall-clock reading paired with a monotonic one, used to convert event
+# times back to wall time for serialization
+_WALL_ANCHOR = time.time()
+_MONO_ANCHOR = time.monotonic()
+
+
+def find_failing_pods(
+    status: np.ndarray, latency: np.ndarray, threshold: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized pod scan over column arrays (status as int, latency in ms).
+
+    Returns (failed_idx, slow_idx): indices of pods in a failed state and
+    of RUNNING pods above the latency threshold. Callers build
+    FailureEvents only for these rows.
+    """
+    failed = (status == PodStatus.FAILED) | (status == PodStatus.CRASH_LOOP)
+    slow = (status == PodStatus.RUNNING) & (latency > threshold)
+    return np.flatnonzero(failed), np.flatnonzero(slow)
+
+
 class FailureEvent:
-    """Structured failure event emitted by the detector."""
+    """
+    Structured failure event emitted by the detector.
+
+    The message may be a str.format template with message_args; it is
+    only formatted when first read, so duplicate events that _emit drops
+    never pay for string building. Events are timestamped with the
+    monotonic clock (immune to NTP steps); .timestamp reports wall time.
+    """
+
+    __slots__ = (
+        "kind", "resource_type", "resource_name", "_msg_template", "_msg_args",
+        "severity", "details", "monotonic", "resolved",
+    )
 
     def __init__(
         self,
@@ -31,16 +80,30 @@ class FailureEvent:
         message: str,
         severity: str = "Warning",
         details: Optional[Dict] = None,
+        message_args: tuple = (),
     ):
         self.kind = kind
         self.resource_type = resource_type
         self.resource_name = resource_name
-        self.message = message
+        self._msg_template = message
+        self._msg_args = message_args
         self.severity = severity
         self.details = details or {}
-        self.timestamp = time.time()
+        self.monotonic = time.monotonic()
         self.resolved = False
 
+    @property
+    def message(self) -> str:
+        if self._msg_args:
+            self._msg_template = self._msg_template.format(*self._msg_args)
+            self._msg_args = ()
+        return self._msg_template
+
+    @property
+    def timestamp(self) -> float:
+        """Wall-clock time of the event."""
+        return _WALL_ANCHOR + (self.monotonic - _MONO_ANCHOR)
+
     def to_dict(self) -> dict:
         return {
             "kind": self.kind,
@@ -62,40 +125,100 @@ class FailureDetector:
     when a failure is detected, enabling zero-delay recovery.
     """
 
+    # Wakes the loop on stop()
+    _STOP = ("", None)
+
     def __init__(
         self,
         cluster: Cluster,
         latency_threshold_ms: float = 200.0,
-        check_interval: float = 2.0,
+        check_interval: float = 60.0,
+        max_history: int = 10_000,
     ):
         self.cluster = cluster
         self.latency_threshold_ms = latency_threshold_ms
         self.check_interval = check_interval
-        self._callbacks: List[Callable[[FailureEvent], None]] = []
-        self._active_failures: Dict[str, FailureEvent] = {}
-        self.failure_history: List[FailureEvent] = []
+        # Replaced (never mutated) on registration so _emit reads it lock-free
+        self._callbacks: Tuple[Callable[[FailureEvent], None], ...] = ()
+        # Receive every new event of a detection pass in one call
+        self._batch_callbacks: Tuple[Callable[[List[FailureEvent]], None], ...] = ()
+        self._callbacks_lock = threading.Lock()
+        # Callback failures, logged to the cluster on the next reconcile pass
+        self._callback_errors: Deque[str] = deque(maxlen=100)
+        # Guards structural changes to the failure tables and counters;
+        # readers copy under it and format outside
+        self._lock = threading.RLock()
+        # (resource_type, resource_name) -> {kind: latest event}
+        self._active_failures: Dict[Tuple[str, str], Dict[str, FailureEvent]] = {}
+        self.failure_history: Deque[FailureEvent] = deque(maxlen=max_history)
+        # Running totals so summaries never rescan history
+        self._total_emitted = 0
+        self._by_kind: Counter = Counter()
+        self._active_count = 0
+        self._resolved_count = 0
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self._event_q: "queue.Queue[tuple]" = queue.Queue()
+        # Healthy pods bucketed by (label, value), plus the labels each
+        # member was filed under; see _index_healthy_pods
+        self._index_lock = threading.Lock()
+        self._healthy_index: Dict[Optional[Tuple[str, str]], Dict[Pod, None]] = {}
+        self._healthy_labels: Dict[Pod, Mapping[str, str]] = {}
 
     # ── Callback Registration ────────────────────────────────────
 
     def on_failure(self, callback: Callable[[FailureEvent], None]):
         """Register a callback that fires when a failure is detected."""
-        self._callbacks.append(callback)
+        with self._callbacks_lock:
+            self._callbacks = self._callbacks + (callback,)
+
+    def on_failures(self, callback: Callable[[List[FailureEvent]], None]):
+        """
+        Register a callback that receives each detection pass's new
+        failures as one list, after the per-event callbacks have run.
+        """
+        with self._callbacks_lock:
+            self._batch_callbacks = self._batch_callbacks + (callback,)
+
+    def _emit_batch(self, events: List[FailureEvent]):
+        if not events:
+            return
+        for cb in self._batch_callbacks:
+            try:
+                cb(events)
+            except Exception as e:
+                self._callback_errors.append(str(e))
+
+    def has_active(self, resource_type: str, resource_name: str, kind: str) -> bool:
+        """True if an unresolved failure of this kind is already tracked."""
+        current = self._active_failures.get((resource_type, resource_name), {}).get(kind)
+        return current is not None and not current.resolved
 
     def _emit(self, event: FailureEvent):
         """Emit a failure event to all subscribers."""
-        key = f"{event.resource_type}:{event.resource_name}:{event.kind}"
-        if key in self._active_failures and not self._active_failures[key].resolved:
-            return  # Already tracking this failure
-        self._active_failures[key] = event
-        self.failure_history.append(event)
+        with self._lock:
+            by_kind = self._active_failures.setdefault((event.resource_type, event.resource_name), {})
+            current = by_kind.get(event.kind)
+            if current is not None:
+                if not current.resolved:
+                    return  # Already tracking this failure
+                self._resolved_count -= 1  # Superseded by the recurrence
+            by_kind[event.kind] = event
+            self._active_count += 1
+            self._total_emitted += 1
+            self._by_kind[event.kind] += 1
+            self.failure_history.append(event)
         self.cluster._log_event(event.kind, event.message, event.severity)
         for cb in self._callbacks:
             try:
                 cb(event)
             except Exception as e:
-                self.cluster._log_event("CallbackError", str(e), "Error")
+                self._callback_errors.append(str(e))
+
+    def _flush_callback_errors(self):
+        """Move queued callback errors into the cluster event log."""
+        while self._callback_errors:
+            self.cluster._log_event("CallbackError", self._callback_errors.popleft(), "Error")
 
     # ── Detection Logic ──────────────────────────────────────────
 
@@ -103,119 +226,317 @@ class FailureDetector:
         """Run all detection checks and return new failures."""
         events = []
         events.extend(self._detect_node_failures())
-        events.extend(self._detect_pod_failures())
-        events.extend(self._detect_service_failures())
-        events.extend(self._detect_latency_violations())
+        # Scan after node callbacks have run; the pod table keeps the
+        # status/latency columns current, and rows is copied because
+        # recovery callbacks may free or reuse rows while we materialize
+        pods = self.cluster.all_pods()
+        table = self.cluster.pod_table
+        rows = list(table.pods)
+        failed_idx, slow_idx = find_failing_pods(table.status, table.latency, self.latency_threshold_ms)
+        events.extend(self._detect_pod_failures(rows, failed_idx))
+        index = self._index_healthy_pods(pods)
+        with self._index_lock:
+            # The event path keeps its own copy up to date from here on
+            self._healthy_index = {key: dict(bucket) for key, bucket in index.items()}
+            self._healthy_labels = {pod: pod.labels for pod in index.get(None, ())}
+        events.extend(self._detect_service_failures(index))
+        events.extend(self._detect_latency_violations(rows, slow_idx))
+        self._emit_batch(events)
+        self._flush_callback_errors()
         return events
 
     def _detect_node_failures(self) -> List[FailureEvent]:
         events = []
         for node in self.cluster.nodes:
-            if node.status == NodeStatus.NOT_READY:
-                ev = FailureEvent(
-                    kind="NodeNotReady",
-                    resource_type="Node",
-                    resource_name=node.name,
-                    message=f"Node '{node.name}' is NotReady — {node.pod_count} pods affected",
-                    severity="Critical",
-                    details={"pod_count": node.pod_count, "pods": [p.name for p in node.pods]},
-                )
+            ev = self._check_node(node)
+            if ev:
                 events.append(ev)
-                self._emit(ev)
         return events
 
-    def _detect_pod_failures(self) -> List[FailureEvent]:
-        events = []
-        for pod in self.cluster.all_pods():
-            if pod.status in (PodStatus.FAILED, PodStatus.CRASH_LOOP):
-                ev = FailureEvent(
-                    kind="PodFailure",
-                    resource_type="Pod",
-                    resource_name=pod.name,
-                    message=f"Pod '{pod.name}' is {pod.status.value} (restarts: {pod.restart_count})",
-                    severity="Warning" if pod.status == PodStatus.CRASH_LOOP else "Critical",
-                    details={
-                        "status": pod.status.value,
-                        "restart_count": pod.restart_count,
-                        "node": pod.node_name,
-                        "deployment": pod.deployment_name,
-                    },
-                )
-                events.append(ev)
-                self._emit(ev)
-        return events
+    def _detect_pod_failures(self, pods: List[Pod], failed_idx: np.ndarray) -> List[FailureEvent]:
+        """
+        Materialize events for the rows find_failing_pods flagged as failed.
+        Each pod is re-checked live, since an earlier event's callback may
+        already have restarted or terminated it.
+        """
+        events = (self._check_pod(pods[i]) for i in failed_idx)
+        return [ev for ev in events if ev]
 
-    def _detect_service_failures(self) -> List[FailureEvent]:
+    def _detect_service_failures(self, index: Dict) -> List[FailureEvent]:
         events = []
-        all_pods = self.cluster.all_pods()
         for svc in self.cluster.services:
-            endpoints = svc.get_healthy_endpoints(all_pods)
-            if len(endpoints) == 0:
-                ev = FailureEvent(
-                    kind="ServiceUnreachable",
-                    resource_type="Service",
-                    resource_name=svc.name,
-                    message=f"Service '{svc.name}' has 0 healthy endpoints",
-                    severity="Critical",
-                    details={"selector": svc.selector},
-                )
+            ev = self._check_service(svc, index)
+            if ev:
                 events.append(ev)
-                self._emit(ev)
         return events
 
-    def _detect_latency_violations(self) -> List[FailureEvent]:
-        events = []
-        for pod in self.cluster.all_pods():
-            if pod.status == PodStatus.RUNNING and pod.latency_ms > self.latency_threshold_ms:
-                ev = FailureEvent(
-                    kind="HighLatency",
-                    resource_type="Pod",
-                    resource_name=pod.name,
-                    message=f"Pod '{pod.name}' latency {pod.latency_ms:.0f}ms > threshold {self.latency_threshold_ms}ms",
-                    severity="Warning",
-                    details={"latency_ms": pod.latency_ms, "threshold": self.latency_threshold_ms},
-                )
-                events.append(ev)
-                self._emit(ev)
-        return events
+    def _detect_latency_violations(self, pods: List[Pod], slow_idx: np.ndarray) -> List[FailureEvent]:
+        """Materialize events for the rows find_failing_pods flagged as slow, re-checked live."""
+        events = (self._check_latency(pods[i]) for i in slow_idx)
+        return [ev for ev in events if ev]
+
+    # ── Per-Resource Checks ──────────────────────────────────────
+
+    def _check_node(self, node: KubeNode) -> Optional[FailureEvent]:
+        if node.status != NodeStatus.NOT_READY:
+            return None
+        if self.has_active("Node", node.name, "NodeNotReady"):
+            return None
+        ev = FailureEvent(
+            kind="NodeNotReady",
+            resource_type="Node",
+            resource_name=node.name,
+            message="Node '{}' is NotReady — {} pods affected",
+            message_args=(node.name, node.pod_count),
+            severity="Critical",
+            details={"pod_count": node.pod_count, "pods": [p.name for p in node.pods]},
+        )
+        self._emit(ev)
+        return ev
+
+    def _check_pod(self, pod: Pod) -> Optional[FailureEvent]:
+        if pod.status not in POD_FAILED_STATES:
+            return None
+        return self._pod_failure_event(pod)
+
+    def _pod_failure_event(self, pod: Pod) -> Optional[FailureEvent]:
+        status = pod.status
+        if status not in SEV_BY_STATUS or self.has_active("Pod", pod.name, "PodFailure"):
+            return None
+        ev = FailureEvent(
+            kind="PodFailure",
+            resource_type="Pod",
+            resource_name=pod.name,
+            message="Pod '{}' is {} (restarts: {})",
+            message_args=(pod.name, status.label, pod.restart_count),
+            severity=SEV_BY_STATUS[status],
+            details={
+                "status": status.label,
+                "restart_count": pod.restart_count,
+                "node": pod.node_name,
+                "deployment": pod.deployment_name,
+            },
+        )
+        self._emit(ev)
+        return ev
+
+    @staticmethod
+    def _index_healthy_pods(pods: List[Pod]) -> Dict[Optional[Tuple[str, str]], Dict[Pod, None]]:
+        """
+        Bucket healthy pods by each (label, value) they carry, so every
+        service can be checked against its selector without rescanning
+        all pods. The None bucket holds every healthy pod. Buckets are
+        insertion-ordered dicts so single pods can be moved in and out.
+        """
+        index: Dict[Optional[Tuple[str, str]], Dict[Pod, None]] = defaultdict(dict)
+        for pod in pods:
+            if pod.status != PodStatus.RUNNING or not pod.health_ok:
+                continue
+            index[None][pod] = None
+            for item in pod.labels.items():
+                index[item][pod] = None
+        return index
+
+    def _reindex_pod(self, pod: Pod) -> Optional[Mapping[str, str]]:
+        """
+        Move one pod into or out of the healthy index after it changed.
+        Returns the labels it was filed under if it left (or was
+        relabeled), i.e. when services selecting it may have lost an
+        endpoint; None otherwise.
+        """
+        healthy = (
+            pod.status == PodStatus.RUNNING and pod.health_ok
+            and pod._table is self.cluster.pod_table
+        )
+        labels = pod.labels if healthy else None
+        with self._index_lock:
+            index = self._healthy_index
+            old = self._healthy_labels.get(pod)
+            if old is labels:
+                return None
+            if old is not None:
+                for key in (None, *old.items()):
+                    bucket = index.get(key)
+                    if bucket is not None:
+                        bucket.pop(pod, None)
+                        if not bucket:
+                            del index[key]
+                del self._healthy_labels[pod]
+            if labels is not None:
+                for key in (None, *labels.items()):
+                    index.setdefault(key, {})[pod] = None
+                self._healthy_labels[pod] = labels
+        return old
+
+    @staticmethod
+    def _has_endpoints(svc: Service, index: Dict) -> bool:
+        if not svc.selector:
+            return bool(index.get(None))
+        buckets = [index.get(item, ()) for item in svc.selector.items()]
+        smallest = min(buckets, key=len)
+        if len(buckets) == 1:
+            return bool(smallest)
+        return any(
+            all(p.labels.get(k) == v for k, v in svc.selector.items())
+            for p in smallest
+        )
+
+    def _check_service(self, svc: Service, index: Dict) -> Optional[FailureEvent]:
+        if self.has_active("Service", svc.name, "ServiceUnreachable"):
+            return None
+        if self._has_endpoints(svc, index):
+            return None
+        return self._service_event(svc)
+
+    def _service_event(self, svc: Service) -> Optional[FailureEvent]:
+        if self.has_active("Service", svc.name, "ServiceUnreachable"):
+            return None
+        ev = FailureEvent(
+            kind="ServiceUnreachable",
+            resource_type="Service",
+            resource_name=svc.name,
+            message="Service '{}' has 0 healthy endpoints",
+            message_args=(svc.name,),
+            severity="Critical",
+            details={"selector": svc.selector},
+        )
+        self._emit(ev)
+        return ev
+
+    def _check_latency(self, pod: Pod) -> Optional[FailureEvent]:
+        if pod.status != PodStatus.RUNNING or pod.latency_ms <= self.latency_threshold_ms:
+            return None
+        return self._latency_event(pod)
+
+    def _latency_event(self, pod: Pod) -> Optional[FailureEvent]:
+        if self.has_active("Pod", pod.name, "HighLatency"):
+            return None
+        ev = FailureEvent(
+            kind="HighLatency",
+            resource_type="Pod",
+            resource_name=pod.name,
+            message="Pod '{}' latency {:.0f}ms > threshold {}ms",
+            message_args=(pod.name, pod.latency_ms, self.latency_threshold_ms),
+            severity="Warning",
+            details={"latency_ms": pod.latency_ms, "threshold": self.latency_threshold_ms},
+        )
+        self._emit(ev)
+        return ev
+
+    def _check_services_selecting(self, pod: Pod) -> List[FailureEvent]:
+        """
+        Re-check the services that selected this pod, and only if it just
+        left the healthy set: a pod joining can't make a service unreachable.
+        """
+        labels = self._reindex_pod(pod)
+        if labels is None:
+            return []
+        services = [
+            svc for svc in self.cluster.services
+            if all(labels.get(k) == v for k, v in svc.selector.items())
+        ]
+        with self._index_lock:
+            down = [svc for svc in services if not self._has_endpoints(svc, self._healthy_index)]
+        return [ev for ev in map(self._service_event, down) if ev]
+
+    def _dispatch(self, resource_type: str, resource):
+        """Re-examine a single resource after a cluster change notification."""
+        self._dispatch_batch([(resource_type, resource)])
+
+    def _dispatch_batch(self, changes: List[tuple]):
+        """
+        Re-examine each changed resource once, however many notifications
+        it raised, and hand all resulting failures to the batch callbacks
+        together.
+        """
+        found: List[Optional[FailureEvent]] = []
+        seen = set()
+        for resource_type, resource in changes:
+            if resource is None or (resource_type, id(resource)) in seen:
+                continue
+            seen.add((resource_type, id(resource)))
+            if resource_type == "Node":
+                found.append(self._check_node(resource))
+                for pod in list(resource.pods):
+                    found.append(self._check_pod(pod))
+                    found.extend(self._check_services_selecting(pod))
+            elif resource_type == "Pod":
+                found.append(self._check_pod(resource))
+                found.append(self._check_latency(resource))
+                found.extend(self._check_services_selecting(resource))
+            elif resource_type == "Service":
+                with self._index_lock:
+                    down = not self._has_endpoints(resource, self._healthy_index)
+                if down:
+                    found.append(self._service_event(resource))
+        self._emit_batch([ev for ev in found if ev])
 
     def resolve(self, resource_type: str, resource_name: str):
         """Mark an active failure as resolved."""
-        for key, event in self._active_failures.items():
-            if event.resource_type == resource_type and event.resource_name == resource_name:
-                event.resolved = True
+        with self._lock:
+            for event in self._active_failures.get((resource_type, resource_name), {}).values():
+                if not event.resolved:
+                    event.resolved = True
+                    self._active_count -= 1
+                    self._resolved_count += 1
 
     # ── Continuous Monitoring Thread ─────────────────────────────
 
     def start(self):
         """Start continuous background detection."""
         self._running = True
+        self.cluster.subscribe(self._on_cluster_change)
+        self.cluster.watch_latency(self.latency_threshold_ms)
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
 
     def stop(self):
-        self._running = False
+        was_running, self._running = self._running, False
+        self.cluster.unsubscribe(self._on_cluster_change)
+        if was_running:
+            self.cluster.unwatch_latency(self.latency_threshold_ms)
+        self._event_q.put(self._STOP)
+
+    def _on_cluster_change(self, resource_type: str, resource):
+        self._event_q.put((resource_type, resource))
 
     def _run_loop(self):
+        next_reconcile = time.monotonic()
         while self._running:
-            self.detect_all()
-            time.sleep(self.check_interval)
+            timeout = next_reconcile - time.monotonic()
+            if timeout <= 0:
+                # Full pass catches anything the change stream missed
+                self.detect_all()
+                next_reconcile = time.monotonic() + self.check_interval
+                continue
+            try:
+                changes = [self._event_q.get(timeout=timeout)]
+            except queue.Empty:
+                continue
+            # Fold in everything else that queued up while we were busy
+            while True:
+                try:
+                    changes.append(self._event_q.get_nowait())
+                except queue.Empty:
+                    break
+            self._dispatch_batch(changes)
 
     # ── Metrics ──────────────────────────────────────────────────
 
+    def _tracked_events(self):
+        for by_kind in self._active_failures.values():
+            yield from by_kind.values()
+
     def get_active_failures(self) -> List[Dict]:
-        return [e.to_dict() for e in self._active_failures.values() if not e.resolved]
+        with self._lock:
+            active = [e for e in self._tracked_events() if not e.resolved]
+        return [e.to_dict() for e in active]
 
     def get_failure_summary(self) -> Dict:
-        total = len(self.failure_history)
-        active = sum(1 for e in self._active_failures.values() if not e.resolved)
-        resolved = sum(1 for e in self._active_failures.values() if e.resolved)
-        by_kind = {}
-        for e in self.failure_history:
-            by_kind[e.kind] = by_kind.get(e.kind, 0) + 1
-        return {
-            "total_failures_detected": total,
-            "active_failures": active,
-            "resolved_failures": resolved,
-            "by_kind": by_kind,
-        }
+        with self._lock:
+            return {
+                "total_failures_detected": self._total_emitted,
+                "active_failures": self._active_count,
+                "resolved_failures": self._resolved_count,
+                "by_kind": dict(self._by_kind),
+            }
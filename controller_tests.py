@@ -0,0 +1,417 @@
+"""
+═══════════════════════════════════════════════════════════════════════
+  CLUSTER CONTROL PLANE — TEST SUITE
+  Scheduling, pod table, failure detection, health windows, deployment
+═══════════════════════════════════════════════════════════════════════
+
+Each test prints PASS or FAIL.
+"""
+
+import sys
+import os
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import controller.cluster as cluster_module
+from controller.cluster import (
+    Cluster, KubeNode, Pod, Deployment, Service, PodStatus, POD_FAILED_STATES,
+)
+from controller.failure_detector import FailureDetector, find_failing_pods
+from monitor.health_checker import HealthChecker, HealthRecord
+from deployment.deployer import BlueGreenDeployer
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  INFRASTRUCTURE
+# ═══════════════════════════════════════════════════════════════════
+
+_results = []
+
+
+def run_test(name, fn):
+    try:
+        fn()
+        print(f"  [PASS] {name}")
+        _results.append((name, True, ""))
+    except Exception as e:
+        print(f"  [FAIL] {name}")
+        print(f"         Error: {e}")
+        _results.append((name, False, str(e)))
+
+
+def make_cluster(nodes=3, replicas=4, seed=42):
+    """Helper: a small cluster with one deployment behind one service."""
+    cluster = Cluster(seed=seed)
+    for i in range(nodes):
+        cluster.add_node(KubeNode(f"node-{i:02d}"))
+    cluster.create_deployment(Deployment("api", replicas=replicas))
+    cluster.create_service(Service("api-svc", selector={"app": "api"}))
+    return cluster
+
+
+def wait_until(predicate, timeout=2.0):
+    """Poll until predicate() holds; the detector thread works asynchronously."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class StubService:
+    """Docker service stand-in: one running green task, records updates."""
+
+    attrs = {"Spec": {"TaskTemplate": {"ContainerSpec": {"Image": "app:v1"}}}}
+
+    def __init__(self):
+        self.updates = []
+
+    def update(self, **kwargs):
+        self.updates.append(kwargs.get("image"))
+
+    def tasks(self, filters=None):
+        return [{"Status": {"State": "running"}, "Spec": {"ContainerSpec": {"Image": "app:v2"}}}]
+
+
+class StubClient:
+    def __init__(self, service):
+        self.services = self
+        self._service = service
+
+    def get(self, name):
+        return self._service
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  SCHEDULING & POD TABLE
+# ═══════════════════════════════════════════════════════════════════
+
+def test_heap_scheduling_follows_node_state():
+    """Least-loaded scheduling skips NotReady nodes and resumes after recovery."""
+    cluster = make_cluster(nodes=3, replicas=3)
+    counts = [n.pod_count for n in cluster.nodes]
+    assert counts == [1, 1, 1], f"Uneven initial spread: {counts}"
+
+    down = cluster.nodes[0]
+    down.mark_not_ready()
+    for i in range(4):
+        target = cluster.schedule_pod(Pod(f"extra-{i}"))
+        assert target is not None and target is not down, f"Scheduled onto {target and target.name}"
+    assert down.pod_count == 1
+
+    down.mark_ready()
+    target = cluster.schedule_pod(Pod("after-recovery"))
+    assert target is down, f"Least-loaded node not chosen: {target.name}"
+
+    heap = cluster._node_heap
+    for i in range(1, len(heap)):
+        assert heap[(i - 1) // 2] <= heap[i], "Heap invariant broken"
+
+
+def test_pod_table_write_through():
+    """Status and latency setters write through; removal frees the row."""
+    cluster = make_cluster(nodes=1, replicas=2)
+    table = cluster.pod_table
+    pod = cluster.all_pods()[0]
+    row = pod._row
+
+    pod.crash()
+    assert table.status[row] == PodStatus.CRASH_LOOP
+    pod.latency_ms = 123.5
+    assert table.latency[row] == 123.5
+
+    version = table.version
+    cluster.delete_pod(pod)
+    assert pod._table is None and table.pods[row] is None
+    assert table.status[row] == table.EMPTY
+    assert table.version > version
+
+
+def test_pod_labels_serialize_as_copies():
+    """Mutating a serialized pod's labels leaves pods sharing that label set alone."""
+    a = Pod("a", labels={"app": "api", "tier": "web"})
+    b = Pod("b", labels={"app": "api", "tier": "web"})
+    assert a.labels is b.labels, "Identical label sets are not shared"
+    a.to_dict()["labels"]["tier"] = "db"
+    assert a.labels["tier"] == "web" and b.labels["tier"] == "web"
+    assert Pod("c", labels={"app": "api", "tier": "web"}).labels["tier"] == "web"
+    assert len(cluster_module._label_pool) <= cluster_module._LABEL_POOL_MAX
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  FAILURE DETECTION
+# ═══════════════════════════════════════════════════════════════════
+
+def test_find_failing_pods_matches_scalar():
+    """Vectorized scan flags exactly the rows the per-pod checks would."""
+    rng = random.Random(7)
+    statuses = [s.value for s in PodStatus] + [-1]
+    status = np.array([rng.choice(statuses) for _ in range(500)], dtype=np.int8)
+    latency = np.array([rng.uniform(0, 400) for _ in range(500)])
+    threshold = 200.0
+
+    failed_idx, slow_idx = find_failing_pods(status, latency, threshold)
+
+    failed_values = {s.value for s in POD_FAILED_STATES}
+    expected_failed = [i for i, s in enumerate(status) if s in failed_values]
+    expected_slow = [
+        i for i, (s, lat) in enumerate(zip(status, latency))
+        if s == PodStatus.RUNNING and lat > threshold
+    ]
+    assert failed_idx.tolist() == expected_failed
+    assert slow_idx.tolist() == expected_slow
+
+
+def test_event_dispatch_emits_once():
+    """Change notifications raise PodFailure / ServiceUnreachable exactly once."""
+    cluster = make_cluster(nodes=2, replicas=2)
+    detector = FailureDetector(cluster, check_interval=60.0)
+    assert detector.detect_all() == []
+    seen = []
+    detector.on_failure(lambda ev: seen.append((ev.kind, ev.resource_name)))
+    detector.start()
+    try:
+        first, second = cluster.all_pods()
+        first.crash()
+        first.crash()  # Second notification for an already-tracked failure
+        assert wait_until(lambda: ("PodFailure", first.name) in seen), f"No PodFailure: {seen}"
+        assert not any(kind == "ServiceUnreachable" for kind, _ in seen), "Service still has an endpoint"
+
+        second.fail()
+        assert wait_until(lambda: ("ServiceUnreachable", "api-svc") in seen), f"No ServiceUnreachable: {seen}"
+        time.sleep(0.1)
+    finally:
+        detector.stop()
+
+    # A reconcile pass must not re-raise anything the event path reported
+    assert detector.detect_all() == []
+    assert sorted(seen) == sorted([
+        ("PodFailure", first.name),
+        ("PodFailure", second.name),
+        ("ServiceUnreachable", "api-svc"),
+    ]), f"Unexpected events: {seen}"
+
+
+def test_latency_crossing_notifies():
+    """A probe pushing latency over the threshold is caught without a reconcile pass."""
+    cluster = make_cluster(nodes=1, replicas=2)
+    detector = FailureDetector(cluster, latency_threshold_ms=200.0)
+    assert detector.check_interval >= 60.0
+    seen = []
+    detector.on_failure(lambda ev: seen.append((ev.kind, ev.resource_name)))
+    detector.start()
+    try:
+        assert cluster.pod_table.latency_watch == (200.0,)
+        pod = cluster.all_pods()[0]
+        assert wait_until(lambda: detector._healthy_labels), "Initial reconcile did not run"
+        pod.check_health(latency_ms=150.0)
+        pod.check_health(latency_ms=450.0)
+        assert wait_until(lambda: ("HighLatency", pod.name) in seen), f"No HighLatency: {seen}"
+    finally:
+        detector.stop()
+    assert cluster.pod_table.latency_watch == ()
+
+
+def test_detect_all_rechecks_flagged_pods():
+    """A callback that restarts or terminates flagged siblings mid-pass raises nothing for them."""
+    cluster = make_cluster(nodes=2, replicas=4)
+    detector = FailureDetector(cluster, latency_threshold_ms=200.0)
+    first, restarted, terminated, slow = cluster.all_pods()
+    for pod in (first, restarted, terminated):
+        pod.crash()
+    slow.latency_ms = 500.0
+
+    def recover(ev):
+        if ev.resource_name == first.name:
+            restarted.start()
+            terminated.terminate()
+            slow.terminate()
+
+    detector.on_failure(recover)
+    events = detector.detect_all()
+    kinds = [(ev.kind, ev.resource_name) for ev in events]
+    assert ("PodFailure", first.name) in kinds, f"Missing first failure: {kinds}"
+    for pod in (restarted, terminated, slow):
+        assert all(name != pod.name for _, name in kinds), f"Stale event for {pod.name}: {kinds}"
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  HEALTH CHECKER
+# ═══════════════════════════════════════════════════════════════════
+
+def test_health_window_average():
+    """avg_latency is the mean of healthy checks among the last 20."""
+    rec = HealthRecord("pod-x", max_history=100)
+    rng = random.Random(3)
+    history = []
+    for _ in range(60):
+        healthy = rng.random() > 0.2
+        latency = round(rng.uniform(5, 80), 1)
+        rec.record(healthy, latency if healthy else 0.0)
+        history.append((healthy, latency))
+    window = [lat for ok, lat in history[-20:] if ok]
+    expected = round(sum(window) / len(window), 1)
+    assert abs(rec.avg_latency - expected) <= 0.1, f"{rec.avg_latency} != {expected}"
+    assert rec.total_checks == 60 and len(rec.recent(10)) == 10
+
+
+def test_health_checker_seeded_and_stop_safe():
+    """Seeded checkers draw identical latencies; a shut-down pool ends the cycle quietly."""
+    runs = []
+    for _ in range(2):
+        cluster = make_cluster(nodes=2, replicas=6)
+        for pod in cluster.all_pods():
+            pod.start()
+        checker = HealthChecker(cluster, seed=11)
+        checker.check_all()
+        runs.append([round(p.latency_ms, 6) for p in cluster.all_pods()])
+    assert runs[0] == runs[1], "Seeded checkers diverged"
+
+    checker = HealthChecker(cluster, max_workers=2)
+    checker._pool = ThreadPoolExecutor(max_workers=1)
+    checker._pool.shutdown()
+    checker.check_all()  # Must not raise
+    assert checker.records == {}, "Abandoned cycle recorded results"
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  BLUE-GREEN DEPLOYMENT
+# ═══════════════════════════════════════════════════════════════════
+
+def test_deployer_early_stop_on_pass():
+    """Green goes live once PASS_THRESHOLD probes pass; the rest are aborted."""
+    service = StubService()
+    deployer = BlueGreenDeployer(client=StubClient(service))
+    deployer.PROBE_STAGGER_S = 0.5
+    started, aborted = [], []
+    lock = threading.Lock()
+
+    def probe(conns, delay=0.0, abort=None):
+        if abort.wait(delay):
+            with lock:
+                aborted.append(delay)
+            return False
+        with lock:
+            started.append(delay)
+        return True
+
+    deployer._wait_until_serving = lambda conns, deadline: True
+    deployer._probe_once = probe
+    t0 = time.monotonic()
+    state = deployer.deploy("api", "app:v2", health_port=1)
+    elapsed = time.monotonic() - t0
+
+    assert state.status == "live", f"Status {state.status}: {state.message}"
+    assert state.health_checks_passed == deployer.PASS_THRESHOLD
+    assert sorted(started) == [0.0, 0.5] and aborted == [1.0], f"started={started} aborted={aborted}"
+    assert elapsed < 1.0, f"Did not stop early ({elapsed:.2f}s)"
+    assert service.updates == ["app:v2"]
+
+
+def test_deployer_early_stop_on_fail():
+    """Once the threshold is out of reach green is rolled back without waiting."""
+    service = StubService()
+    deployer = BlueGreenDeployer(client=StubClient(service))
+    deployer.PROBE_STAGGER_S = 0.5
+
+    def probe(conns, delay=0.0, abort=None):
+        abort.wait(delay)
+        return False
+
+    deployer._wait_until_serving = lambda conns, deadline: True
+    deployer._probe_once = probe
+
+    t0 = time.monotonic()
+    state = deployer.deploy("api", "app:v2", health_port=1)
+    elapsed = time.monotonic() - t0
+
+    assert state.status == "rolled_back", f"Status {state.status}: {state.message}"
+    assert state.health_checks_passed == 0
+    assert service.updates == ["app:v2", "app:v1"], f"Updates {service.updates}"
+    assert elapsed < 1.0, f"Did not stop early ({elapsed:.2f}s)"
+
+
+def test_deployer_counts_each_probe_once():
+    """After the readiness gate, a flapping green gets one result per probe."""
+    service = StubService()
+    deployer = BlueGreenDeployer(client=StubClient(service))
+    deployer.PROBE_STAGGER_S = 0.05
+    deployer.PROBE_RETRY_S = 0.05
+    calls = []
+    lock = threading.Lock()
+
+    def probe(conns, delay=0.0, abort=None):
+        if abort is not None and abort.wait(delay):
+            return False
+        with lock:
+            calls.append(delay)
+            return len(calls) % 2 == 0  # fail, pass, fail, pass, ...
+
+    deployer._probe_once = probe
+    state = deployer.deploy("api", "app:v2", health_port=1)
+
+    # Readiness: fail then pass. Probes: fail, pass, fail -> 1 of 3
+    assert len(calls) == 5, f"Probe calls {calls}"
+    assert state.health_checks_passed == 1
+    assert state.status == "rolled_back", f"Status {state.status}: {state.message}"
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  RUNNER
+# ═══════════════════════════════════════════════════════════════════
+
+def run_all_controller_tests():
+    global _results
+    _results = []
+
+    print("═" * 70)
+    print("  CLUSTER CONTROL PLANE — TEST SUITE")
+    print("═" * 70)
+
+    print("\n  ── Scheduling & Pod Table ──────────────────────────────")
+    run_test("1. Heap Scheduling Follows Node State", test_heap_scheduling_follows_node_state)
+    run_test("2. Pod Table Write-Through", test_pod_table_write_through)
+    run_test("3. Pod Labels Serialize As Copies", test_pod_labels_serialize_as_copies)
+
+    print("\n  ── Failure Detection ───────────────────────────────────")
+    run_test("4. find_failing_pods Matches Scalar", test_find_failing_pods_matches_scalar)
+    run_test("5. Event Dispatch Emits Once", test_event_dispatch_emits_once)
+    run_test("6. detect_all Re-checks Flagged Pods", test_detect_all_rechecks_flagged_pods)
+    run_test("7. Latency Crossing Notifies", test_latency_crossing_notifies)
+
+    print("\n  ── Health Checker ──────────────────────────────────────")
+    run_test("8. Health Window Average", test_health_window_average)
+    run_test("9. Health Checker Seeded And Stop-Safe", test_health_checker_seeded_and_stop_safe)
+
+    print("\n  ── Blue-Green Deployment ───────────────────────────────")
+    run_test("10. Deployer Early Stop On Pass", test_deployer_early_stop_on_pass)
+    run_test("11. Deployer Early Stop On Fail", test_deployer_early_stop_on_fail)
+    run_test("12. Deployer Counts Each Probe Once", test_deployer_counts_each_probe_once)
+
+    passed = sum(1 for _, ok, _ in _results if ok)
+    failed = sum(1 for _, ok, _ in _results if not ok)
+    total = len(_results)
+
+    print("\n" + "═" * 70)
+    print(f"  RESULTS: {passed}/{total} PASSED, {failed}/{total} FAILED")
+    print("═" * 70)
+
+    if failed > 0:
+        print("\n  Failed tests:")
+        for name, ok, err in _results:
+            if not ok:
+                print(f"    x {name}: {err}")
+
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_controller_tests()
+    sys.exit(0 if success else 1)
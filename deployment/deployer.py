@@ -8,14 +8,58 @@ then switches traffic. Keeps old version as fallback.
 """
 
 import time
+import threading
+import queue
 import docker
-import urllib.request
+import http.client
 import json
-from typing import Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Optional, Deque
+
+# Largest /health response body the deployer will read
+MAX_PROBE_BODY = 64 * 1024
+# Longest status message kept on a DeploymentState
+MAX_MESSAGE_LEN = 256
+
+
+class _ProbeConnections:
+    """
+    Keep-alive connections to green's /health, shared by the probes of
+    one deploy(). A probe borrows an idle connection (or opens one) and
+    hands it back if the server left it open.
+    """
+
+    def __init__(self, port: int, timeout: float = 5):
+        self.port = port
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+
+    def acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return http.client.HTTPConnection("localhost", self.port, timeout=self.timeout)
+
+    def release(self, conn: http.client.HTTPConnection):
+        self._idle.put(conn)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
 
 
 class DeploymentState:
     """Tracks the state of a deployment."""
+
+    __slots__ = (
+        "service_name", "status", "blue_image", "green_image", "started_at",
+        "completed_at", "health_checks_passed", "health_checks_total", "_message",
+    )
+
     def __init__(self, service_name: str):
         self.service_name = service_name
         self.status = "idle"  # idle, deploying, validating, live, rolled_back
@@ -27,6 +71,15 @@ class DeploymentState:
         self.health_checks_total = 3
         self.message = ""
 
+    @property
+    def message(self) -> str:
+        return self._message
+
+    @message.setter
+    def message(self, value: str):
+        # Docker error reprs can be arbitrarily long
+        self._message = value[:MAX_MESSAGE_LEN]
+
     def to_dict(self) -> dict:
         return {
             "service_name": self.service_name,
@@ -49,22 +102,108 @@ class BlueGreenDeployer:
 
     Process:
       1. Deploy green alongside blue (start-first)
-      2. Wait 5 seconds for startup
-      3. Run health checks on green
+      2. Wait for a green task to report running (exponential backoff)
+      3. Wait for green to serve /health (retried until a readiness
+         deadline, since a running task may not be serving yet), then run
+         health checks on it (single probes, concurrent and staggered)
       4. If healthy → route traffic to green
       5. Keep blue as fallback
       6. If green fails → revert to blue
     """
 
-    def __init__(self, event_callback=None):
-        self.client = docker.from_env()
+    def __init__(self, event_callback=None, client: Optional[docker.DockerClient] = None):
+        self.client = client or docker.from_env()
         self.deployments: Dict[str, DeploymentState] = {}
-        self.history: List[Dict] = []
+        self.history: Deque[Dict] = deque(maxlen=100)
         self._event_callback = event_callback
 
-    def _push_event(self, event_type: str, data: dict):
+    # Offset between consecutive concurrent health probes
+    PROBE_STAGGER_S = 0.5
+    # Passing probes needed to promote green
+    PASS_THRESHOLD = 2
+    # Backoff schedule while waiting for green to start (~16s ceiling)
+    STARTUP_BACKOFF_S = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0)
+    # How long green may take to start serving /health once running
+    READINESS_TIMEOUT_S = 15.0
+    # Pause between readiness attempts
+    PROBE_RETRY_S = 1.0
+
+    def _push_event(self, event_type: str, state: DeploymentState):
+        """
+        Hand the live state to the callback. It is mutated as the deploy
+        proceeds, so callbacks that keep it must take state.to_dict().
+        """
         if self._event_callback:
-            self._event_callback(event_type, data)
+            self._event_callback(event_type, state)
+
+    def _wait_for_green(self, service, image: str) -> bool:
+        """Poll the service's tasks until one running the new image is up."""
+        for delay in (0.0, *self.STARTUP_BACKOFF_S):
+            if delay:
+                time.sleep(delay)
+            try:
+                tasks = service.tasks(filters={"desired-state": "running"})
+            except Exception:
+                tasks = []
+            for task in tasks:
+                spec_image = task.get("Spec", {}).get("ContainerSpec", {}).get("Image", "")
+                if task.get("Status", {}).get("State") == "running" and spec_image.startswith(image):
+                    return True
+        return False
+
+    def _wait_until_serving(self, conns: "_ProbeConnections", deadline: float) -> bool:
+        """
+        Readiness gate: probe green until its first pass or the deadline.
+        "running" only means the process started; the app may still be
+        binding its port. Passes here don't count toward PASS_THRESHOLD.
+        """
+        while True:
+            if self._probe_once(conns):
+                return True
+            pause = min(self.PROBE_RETRY_S, deadline - time.monotonic())
+            if pause <= 0:
+                return False
+            time.sleep(pause)
+
+    def _probe_once(
+        self,
+        conns: _ProbeConnections,
+        delay: float = 0.0,
+        abort: Optional[threading.Event] = None,
+    ) -> bool:
+        """Wait `delay` seconds, then hit green's /health once (unless aborted)."""
+        if delay:
+            if abort is None:
+                time.sleep(delay)
+            elif abort.wait(delay):
+                return False
+        conn = conns.acquire()
+        reusable = False
+        try:
+            conn.request("GET", "/health", headers={
+                "User-Agent": "BlueGreenDeployer/1.0",
+                "Accept": "application/json",
+            })
+            resp = conn.getresponse()
+            length = resp.getheader("Content-Length")
+            if length and int(length) > MAX_PROBE_BODY:
+                return False
+            body = resp.read(MAX_PROBE_BODY + 1)
+            if len(body) > MAX_PROBE_BODY:
+                return False  # Oversized body without a Content-Length
+            # Only a fully read response leaves the socket reusable
+            reusable = resp.isclosed() and not resp.will_close
+            if resp.status != 200:
+                return False
+            data = json.loads(body)
+            return data.get("status") == "healthy"
+        except Exception:
+            return False
+        finally:
+            if reusable:
+                conns.release(conn)
+            else:
+                conn.close()
 
     def deploy(self, service_name: str, new_image: str, health_port: int) -> DeploymentState:
         """
@@ -91,7 +230,7 @@ class BlueGreenDeployer:
         # Step 1: Deploy green (update with start-first order)
         state.status = "deploying"
         state.message = "Deploying green version alongside blue..."
-        self._push_event("deployment", state.to_dict())
+        self._push_event("deployment", state)
 
         try:
             service.update(
@@ -111,35 +250,22 @@ class BlueGreenDeployer:
             state.status = "failed"
             state.message = f"Deploy failed: {str(e)[:100]}"
             self.history.append(state.to_dict())
-            self._push_event("deployment", state.to_dict())
+            self._push_event("deployment", state)
             return state
 
         # Step 2: Wait for green to start
         state.status = "validating"
-        state.message = "Waiting for green to start (5s)..."
-        self._push_event("deployment", state.to_dict())
-        time.sleep(5)
-
-        # Step 3: Health checks
-        state.message = "Running health checks on green..."
-        self._push_event("deployment", state.to_dict())
-
-        for i in range(state.health_checks_total):
-            try:
-                req = urllib.request.Request(
-                    f"http://localhost:{health_port}/health",
-                    headers={"User-Agent": "BlueGreenDeployer/1.0"}
-                )
-                resp = urllib.request.urlopen(req, timeout=5)
-                data = json.loads(resp.read())
-                if data.get("status") == "healthy":
-                    state.health_checks_passed += 1
-            except Exception:
-                pass
-            time.sleep(2)
+        state.message = "Waiting for green to start..."
+        self._push_event("deployment", state)
+        if self._wait_for_green(service, new_image):
+            # Step 3: Health checks
+            state.message = "Running health checks on green..."
+            self._push_event("deployment", state)
+            self._run_health_checks(state, health_port)
+        # Otherwise green never came up: no probes, straight to rollback
 
         # Step 4: Decision
-        if state.health_checks_passed >= 2:
+        if state.health_checks_passed >= self.PASS_THRESHOLD:
             state.status = "live"
             state.message = f"Green deployed successfully. {state.health_checks_passed}/{state.health_checks_total} checks passed."
             state.completed_at = time.time()
@@ -147,7 +273,7 @@ class BlueGreenDeployer:
             # Step 6: Rollback
             state.status = "rolling_back"
             state.message = f"Green failed. Rolling back to blue... ({state.health_checks_passed}/{state.health_checks_total} checks passed)"
-            self._push_event("deployment", state.to_dict())
+            self._push_event("deployment", state)
 
             try:
                 service.update(image=state.blue_image)
@@ -159,9 +285,45 @@ class BlueGreenDeployer:
             state.completed_at = time.time()
 
         self.history.append(state.to_dict())
-        self._push_event("deployment", state.to_dict())
+        self._push_event("deployment", state)
         return state
 
+    def _run_health_checks(self, state: DeploymentState, health_port: int):
+        """
+        Once green passes the readiness gate, run its probes concurrently
+        and count passes into `state`; each probe counts once, pass or
+        fail. Stops as soon as the outcome is decided: threshold reached,
+        or too few probes left to reach it. Pending probes are aborted.
+        """
+        conns = _ProbeConnections(health_port)
+        deadline = time.monotonic() + self.READINESS_TIMEOUT_S
+        if not self._wait_until_serving(conns, deadline):
+            conns.close()
+            return
+        decided = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=state.health_checks_total)
+        try:
+            probes = [
+                pool.submit(self._probe_once, conns, i * self.PROBE_STAGGER_S, decided)
+                for i in range(state.health_checks_total)
+            ]
+            remaining = state.health_checks_total
+            for probe in as_completed(probes):
+                remaining -= 1
+                if probe.result():
+                    state.health_checks_passed += 1
+                if state.health_checks_passed >= self.PASS_THRESHOLD:
+                    break
+                if state.health_checks_passed + remaining < self.PASS_THRESHOLD:
+                    break
+        finally:
+            decided.set()
+            # Aborted probes return at once; waiting covers at most one
+            # in-flight request, which could otherwise hand its connection
+            # back after close() and leak it
+            pool.shutdown(wait=True)
+            conns.close()
+
     def get_status(self, service_name: str) -> Optional[Dict]:
         s = self.deployments.get(service_name)
         return s.to_dict() if s else None
@@ -169,5 +331,5 @@ class BlueGreenDeployer:
     def get_all(self) -> Dict:
         return {
             "active": {k: v.to_dict() for k, v in self.deployments.items()},
-            "history": self.history[-20:],
+            "history": list(self.history)[-20:],
         }
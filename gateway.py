@@ -14,22 +14,35 @@ Guarantees:
   • No unauthorized region access
 """
 
+import os
 import hashlib
 import hmac
+from binascii import hexlify
 import time
 import secrets
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 # ═══════════════════════════════════════════════════════════════════
 #  CRYPTO HELPERS
 # ═══════════════════════════════════════════════════════════════════
 
+# Bound once for the per-request digests. hashlib's OpenSSL backend
+# already dispatches to SHA-NI / AVX2 compress functions when the CPU
+# has them.
+_sha256 = hashlib.sha256
+_compare_digest = hmac.compare_digest
+_fromhex = bytes.fromhex
+
+# Length of a hex-encoded HMAC-SHA256 signature
+SIGNATURE_HEX_LEN = 64
+
+
 def generate_keypair() -> Tuple[str, str]:
     """Generate a simulated (private_key, public_key) pair using HMAC secrets."""
-    private = secrets.token_hex(32)
-    public = hashlib.sha256(private.encode()).hexdigest()
+    private = os.urandom(32).hex()
+    public = _sha256(private.encode()).hexdigest()
     return private, public
 
 
@@ -38,6 +51,38 @@ def sign(data: str, private_key: str) -> str:
     return hmac.new(private_key.encode(), data.encode(), hashlib.sha256).hexdigest()
 
 
+def keyed_hmac(private_key: str) -> "hmac.HMAC":
+    """
+    HMAC-SHA256 context with the key pads already absorbed. Callers
+    copy() it per message instead of re-deriving ipad/opad each time.
+    """
+    return hmac.new(private_key.encode(), digestmod=hashlib.sha256)
+
+
+def sign_keyed(data: bytes, keyed: "hmac.HMAC") -> str:
+    """sign() over already-encoded data, using a context from keyed_hmac()."""
+    mac = keyed.copy()
+    mac.update(data)
+    return mac.hexdigest()
+
+
+def verify_keyed(data: bytes, signature: str, keyed: "hmac.HMAC") -> bool:
+    """
+    Check a hex signature against sign_keyed(data, keyed). The constant-
+    time compare runs over the 32 raw digest bytes; inputs that cannot
+    be a hex SHA-256 MAC are rejected before any hashing.
+    """
+    if len(signature) != SIGNATURE_HEX_LEN:
+        return False
+    try:
+        raw = _fromhex(signature)
+    except ValueError:
+        return False
+    mac = keyed.copy()
+    mac.update(data)
+    return _compare_digest(mac.digest(), raw)
+
+
 def verify(data: str, signature: str, private_key: str, public_key: str) -> bool:
     """
     Verify that the signature matches sign(data, private_key).
@@ -50,44 +95,123 @@ def verify(data: str, signature: str, private_key: str, public_key: str) -> bool
 
 def hash_request(payload: str, nonce: str, timestamp: str) -> str:
     """Deterministic hash of the signable portion of a request."""
-    raw = f"{payload}|{nonce}|{timestamp}"
-    return hashlib.sha256(raw.encode()).hexdigest()
+    return request_digest(payload, nonce, timestamp).decode()
+
+
+def request_digest(payload: str, nonce: str, timestamp: str) -> bytes:
+    """hash_request() as ASCII hex bytes, ready to feed to sign_keyed()."""
+    raw = "|".join((payload, nonce, timestamp)).encode()
+    return hexlify(_sha256(raw).digest())
+
+
+def gateway_digest(client_id: str, gateway_id: str, request_hash: bytes) -> bytes:
+    """
+    Hash the gateway signs: routing identity plus the client-signed
+    request_digest(), so the payload is only hashed once per hop.
+    """
+    raw = b"|".join((client_id.encode(), gateway_id.encode(), request_hash))
+    return hexlify(_sha256(raw).digest())
 
 
 # ═══════════════════════════════════════════════════════════════════
 #  SECTION 2 — CLIENT REGISTRATION
 # ═══════════════════════════════════════════════════════════════════
 
-@dataclass
 class ClientRecord:
-    """Registered client entry in the registry."""
-    client_id: str
-    public_key: str
-    _private_key: str                       # kept for simulation signing
-    assigned_gateway_id: str
-    allowed_regions: List[str] = field(default_factory=list)
-    rate_limit: int = 10                    # requests per window
-    trust_score: float = 1.0               # [0, 1]
+    """
+    Registered client entry in the registry.
+
+    A plain __slots__ class rather than a slotted dataclass, which would
+    need Python 3.10.
+    """
+
+    __slots__ = (
+        "client_id", "public_key", "_private_key", "assigned_gateway_id",
+        "_allowed_regions", "rate_limit", "trust_score", "_hmac", "slot",
+        "_region_set",
+    )
+
+    def __init__(
+        self,
+        client_id: str,
+        public_key: str,
+        _private_key: str,                  # kept for simulation signing
+        assigned_gateway_id: str,
+        allowed_regions: Optional[Iterable[str]] = None,
+        rate_limit: int = 10,               # requests per window
+        trust_score: float = 1.0,           # [0, 1]
+        _hmac: Optional[hmac.HMAC] = None,
+        slot: int = -1,                     # dense index into per-gateway tables; -1 = unregistered
+    ):
+        self.client_id = client_id
+        self.public_key = public_key
+        self._private_key = _private_key
+        self.assigned_gateway_id = assigned_gateway_id
+        self.allowed_regions = allowed_regions or ()
+        self.rate_limit = rate_limit
+        self.trust_score = trust_score
+        self._hmac = _hmac if _hmac is not None else keyed_hmac(_private_key)
+        self.slot = slot
+
+    @property
+    def allowed_regions(self) -> Tuple[str, ...]:
+        """Regions this client may send from (empty = any). Assign to change."""
+        return self._allowed_regions
+
+    @allowed_regions.setter
+    def allowed_regions(self, regions: Iterable[str]):
+        # A tuple, so the only way to edit it is through this setter,
+        # which keeps the set _validate checks against in step
+        self._allowed_regions = tuple(regions)
+        self._region_set = frozenset(self._allowed_regions)
+
+    def __repr__(self) -> str:
+        return (
+            f"ClientRecord(client_id={self.client_id!r}, "
+            f"assigned_gateway_id={self.assigned_gateway_id!r}, slot={self.slot})"
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════
 #  SECTION 4 — REQUEST FORMAT
 # ═══════════════════════════════════════════════════════════════════
 
-@dataclass
 class GatewayRequest:
     """
     Forwarded request format.  ALL fields are mandatory.
     Requests missing any field must be rejected.
     """
-    client_id: str
-    gateway_id: str
-    timestamp: str
-    nonce: str
-    payload: str
-    signature_client: str
-    signature_gateway: str = ""             # attached by gateway after validation
-    region: str = ""                        # optional region tag
+
+    __slots__ = (
+        "client_id", "gateway_id", "timestamp", "nonce", "payload",
+        "signature_client", "signature_gateway", "region",
+    )
+
+    def __init__(
+        self,
+        client_id: str,
+        gateway_id: str,
+        timestamp: str,
+        nonce: str,
+        payload: str,
+        signature_client: str,
+        signature_gateway: str = "",        # attached by gateway after validation
+        region: str = "",                   # optional region tag
+    ):
+        self.client_id = client_id
+        self.gateway_id = gateway_id
+        self.timestamp = timestamp
+        self.nonce = nonce
+        self.payload = payload
+        self.signature_client = signature_client
+        self.signature_gateway = signature_gateway
+        self.region = region
+
+    def __repr__(self) -> str:
+        return (
+            f"GatewayRequest(client_id={self.client_id!r}, gateway_id={self.gateway_id!r}, "
+            f"nonce={self.nonce!r}, region={self.region!r})"
+        )
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -102,6 +226,7 @@ class ClientRegistry:
 
     def __init__(self):
         self._clients: Dict[str, ClientRecord] = {}
+        self._by_slot: List[ClientRecord] = []   # ClientRecord.slot → record
         self._gateway_ids: set = set()
 
     # ── Registration ──────────────────────────────────────────────
@@ -120,16 +245,24 @@ class ClientRegistry:
             public_key=pub,
             _private_key=priv,
             assigned_gateway_id=gateway_id,
-            allowed_regions=allowed_regions or [],
+            allowed_regions=allowed_regions or (),
             rate_limit=rate_limit,
+            slot=len(self._by_slot),        # the only place slots are handed out
         )
         self._clients[client_id] = record
+        self._by_slot.append(record)
         self._gateway_ids.add(gateway_id)
         return record
 
     def get_client(self, client_id: str) -> Optional[ClientRecord]:
         return self._clients.get(client_id)
 
+    def get_client_by_slot(self, slot: int) -> Optional[ClientRecord]:
+        """Lookup by dense slot, for tables already indexed by ClientRecord.slot."""
+        if 0 <= slot < len(self._by_slot):
+            return self._by_slot[slot]
+        return None
+
     def is_registered(self, client_id: str) -> bool:
         return client_id in self._clients
 
@@ -159,6 +292,71 @@ class ClientRegistry:
         return dict(self._clients)
 
 
+# ═══════════════════════════════════════════════════════════════════
+#  SECTION 10 — NONCE FILTER
+# ═══════════════════════════════════════════════════════════════════
+
+class NonceFilter:
+    """
+    Fixed-size replay cache: a ring of Bloom filters, one per replay
+    window, shared by every client of a gateway. Entries are keyed on
+    (client slot, nonce), so memory does not grow with the client count.
+
+    A nonce is remembered for at least two windows, which covers every
+    timestamp _check_timestamp accepts (at most one window old or one
+    window ahead). False positives reject a fresh nonce; with 3 probes
+    over 1 Mbit per window they stay below 1e-4 at ~10k nonces/window.
+    """
+
+    BITS = 1 << 20                          # 128 KiB per window
+    GENERATIONS = 3
+    _MASK64 = (1 << 64) - 1
+    _K = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9)
+    _SLOT_MIX = 0xFF51AFD7ED558CCD
+
+    __slots__ = ("window", "bits", "_shift", "_epoch", "_filters")
+
+    def __init__(self, window: float, bits: int = BITS):
+        if bits & (bits - 1):
+            raise ValueError("bits must be a power of two")
+        self.window = window
+        self.bits = bits
+        self._shift = 64 - (bits.bit_length() - 1)   # top bits index the filter
+        self._epoch = -1
+        self._filters: deque = deque(maxlen=self.GENERATIONS)
+
+    @staticmethod
+    def _key(nonce: str) -> int:
+        """
+        64-bit digest of the whole nonce. Nonces are client-chosen, so
+        every byte must count: keying on a prefix would make distinct
+        nonces that share it collide on every probe.
+        """
+        return int.from_bytes(hashlib.blake2b(nonce.encode(), digest_size=8).digest(), "little")
+
+    def _rotate(self, now: float):
+        epoch = int(now // self.window)
+        if epoch == self._epoch:
+            return
+        missed = min(epoch - self._epoch, self.GENERATIONS) if self._epoch >= 0 else 1
+        for _ in range(missed):
+            self._filters.append(bytearray(self.bits // 8))
+        self._epoch = epoch
+
+    def check_and_add(self, slot: int, nonce: str, now: float) -> bool:
+        """Record the client's nonce; False if it was (probably) seen already."""
+        self._rotate(now)
+        h = self._key(nonce) ^ ((slot * self._SLOT_MIX) & self._MASK64)
+        probes = [((h * k) & self._MASK64) >> self._shift for k in self._K]
+        for bits in self._filters:
+            if all(bits[i >> 3] & (1 << (i & 7)) for i in probes):
+                return False
+        current = self._filters[-1]
+        for i in probes:
+            current[i >> 3] |= 1 << (i & 7)
+        return True
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  SECTION 3 — GATEWAY
 # ═══════════════════════════════════════════════════════════════════
@@ -186,9 +384,11 @@ class Gateway:
         self.gateway_id = gateway_id
         self.registry = registry
         self._private_key, self._public_key = generate_keypair()
-        self._nonce_cache: Dict[str, set] = {}     # client_id → {nonces}
-        self._request_counts: Dict[str, int] = {}  # client_id → count this window
-        self._window_start: float = time.time()
+        self._hmac = keyed_hmac(self._private_key)
+        self._nonce_filter = NonceFilter(self.NONCE_WINDOW_SECONDS)
+        # Token buckets indexed by ClientRecord.slot (None = not seen yet)
+        self._tokens: List[Optional[float]] = []
+        self._last_refill: List[float] = []
         self._window_seconds: float = 60.0
         self.alive: bool = True
 
@@ -215,9 +415,11 @@ class Gateway:
         if missing:
             return False, f"missing_fields:{','.join(missing)}", None
 
-        # 2 — Client exists?
+        # 2 — Client exists? A record without a slot never went through
+        # register_client, and slot -1 would alias the last client's
+        # token bucket and nonce row
         client = self.registry.get_client(req.client_id)
-        if client is None:
+        if client is None or client.slot < 0:
             return False, "unregistered_client", None
 
         # 3 — Gateway assignment check (Section 7 pre-check)
@@ -228,83 +430,117 @@ class Gateway:
         if client.trust_score < self.TRUST_BLOCK_THRESHOLD:
             return False, "client_blocked_low_trust", None
 
-        # 5 — Client signature verification (Section 5)
-        data_to_verify = hash_request(req.payload, req.nonce, req.timestamp)
-        if not verify(data_to_verify, req.signature_client,
-                      client._private_key, client.public_key):
+        # 5 — Timestamp freshness (Section 10). Stateless, so it runs
+        # before any crypto; stale or malformed requests cost no hashing.
+        # The clock is read once and shared by every check below.
+        now = time.time()
+        ts_ok, ts_reason = self._check_timestamp(req.timestamp, now)
+        if not ts_ok:
+            return False, ts_reason, None
+
+        # 6 — Client signature verification (Section 5)
+        data_to_verify = request_digest(req.payload, req.nonce, req.timestamp)
+        if not verify_keyed(data_to_verify, req.signature_client, client._hmac):
             return False, "invalid_client_signature", None
 
-        # 6 — Replay protection (Section 10)
-        replay_ok, replay_reason = self._check_replay(req.client_id, req.nonce, req.timestamp)
-        if not replay_ok:
-            return False, replay_reason, None
+        # 7 — Replay protection (Section 10). Nonces are only recorded
+        # once the signature is known good, so forgeries cannot burn them
+        if not self._check_nonce(client.slot, req.nonce, now):
+            return False, "replayed_nonce", None
 
-        # 7 — Rate limiting (Section 9)
-        rate_ok, rate_reason = self._check_rate(req.client_id, client.rate_limit)
+        # 8 — Rate limiting (Section 9)
+        rate_ok, rate_reason = self._check_rate(client.slot, client.rate_limit, now)
         if not rate_ok:
             return False, rate_reason, None
 
-        # 8 — Region validation (Section 8)
-        if client.allowed_regions and req.region:
-            if req.region not in client.allowed_regions:
+        # 9 — Region validation (Section 8)
+        if client._region_set and req.region:
+            if req.region not in client._region_set:
                 return False, "region_not_allowed", None
 
-        # 9 — Sign request (Section 6)
-        full_hash = hashlib.sha256(
-            f"{req.client_id}|{req.gateway_id}|{req.payload}|{req.nonce}|{req.timestamp}".encode()
-        ).hexdigest()
-        req.signature_gateway = sign(full_hash, self._private_key)
+        # 10 — Sign request (Section 6)
+        full_hash = gateway_digest(req.client_id, req.gateway_id, data_to_verify)
+        req.signature_gateway = sign_keyed(full_hash, self._hmac)
 
         return True, "accepted", req
 
+    def process_batch(
+        self, reqs: List[GatewayRequest],
+    ) -> List[Tuple[bool, str, Optional[GatewayRequest]]]:
+        """
+        Validate and sign a burst of requests, in arrival order.
+
+        Replay and rate-limit state is shared between requests in the
+        batch exactly as if they had arrived one by one.
+        """
+        if not self.alive:
+            return [(False, "gateway_offline", None)] * len(reqs)
+        process = self.process_request
+        return [process(req) for req in reqs]
+
     # ── Internal validations ──────────────────────────────────────
 
-    def _check_format(self, req: GatewayRequest) -> List[str]:
-        """Return list of missing mandatory fields."""
-        missing = []
-        if not req.client_id:
-            missing.append("client_id")
-        if not req.gateway_id:
-            missing.append("gateway_id")
-        if not req.timestamp:
-            missing.append("timestamp")
-        if not req.nonce:
-            missing.append("nonce")
-        if req.payload is None:
-            missing.append("payload")
-        if not req.signature_client:
-            missing.append("signature_client")
-        return missing
-
-    def _check_replay(self, client_id: str, nonce: str, timestamp: str) -> Tuple[bool, str]:
-        """Section 10: reject reused nonces and stale timestamps."""
-        # Timestamp freshness
+    _FORMAT_FIELDS = (
+        "client_id", "gateway_id", "timestamp", "nonce", "payload", "signature_client",
+    )
+
+    def _check_format(self, req: GatewayRequest) -> Tuple[str, ...]:
+        """Return the missing mandatory fields (empty on the common path)."""
+        mask = (
+            (not req.client_id)
+            | (not req.gateway_id) << 1
+            | (not req.timestamp) << 2
+            | (not req.nonce) << 3
+            | (req.payload is None) << 4
+            | (not req.signature_client) << 5
+        )
+        if not mask:
+            return ()
+        return tuple(name for i, name in enumerate(self._FORMAT_FIELDS) if mask >> i & 1)
+
+    def _check_timestamp(self, timestamp: str, now: float) -> Tuple[bool, str]:
+        """Section 10: timestamp must be within one window of now."""
         try:
             ts = float(timestamp)
         except ValueError:
             return False, "invalid_timestamp"
-        if time.time() - ts > self.NONCE_WINDOW_SECONDS:
+        if now - ts > self.NONCE_WINDOW_SECONDS:
             return False, "expired_timestamp"
-
-        # Nonce uniqueness
-        if client_id not in self._nonce_cache:
-            self._nonce_cache[client_id] = set()
-        if nonce in self._nonce_cache[client_id]:
-            return False, "replayed_nonce"
-        self._nonce_cache[client_id].add(nonce)
+        # Bounds how long a nonce must be remembered
+        if ts - now > self.NONCE_WINDOW_SECONDS:
+            return False, "future_timestamp"
         return True, "ok"
 
-    def _check_rate(self, client_id: str, limit: int) -> Tuple[bool, str]:
-        """Section 9: per-client rate limiting."""
-        now = time.time()
-        if now - self._window_start > self._window_seconds:
-            self._request_counts.clear()
-            self._window_start = now
+    def _check_nonce(self, slot: int, nonce: str, now: float) -> bool:
+        """Section 10: record the nonce; False if already seen."""
+        return self._nonce_filter.check_and_add(slot, nonce, now)
 
-        count = self._request_counts.get(client_id, 0)
-        if count >= limit:
+    def _check_rate(self, slot: int, limit: int, now: Optional[float] = None) -> Tuple[bool, str]:
+        """
+        Section 9: per-client token bucket. Holds up to `limit` requests
+        and refills at `limit` per window, so there is no periodic reset.
+        `now` is the request's wall-clock reading; a clock stepped
+        backwards refills nothing, one stepped forwards at most refills
+        the bucket.
+        """
+        if now is None:
+            now = time.time()
+        if slot >= len(self._tokens):
+            grow = slot + 1 - len(self._tokens)
+            self._tokens.extend([None] * grow)
+            self._last_refill.extend([now] * grow)
+        tokens = self._tokens[slot]
+        if tokens is None:
+            tokens = float(limit)
+        else:
+            elapsed = max(0.0, now - self._last_refill[slot])
+            refill = elapsed * limit / self._window_seconds
+            tokens = min(float(limit), tokens + refill)
+        self._last_refill[slot] = now
+        if tokens < 1.0:
+            self._tokens[slot] = tokens
             return False, "rate_limit_exceeded"
-        self._request_counts[client_id] = count + 1
+        self._tokens[slot] = tokens - 1.0
         return True, "ok"
 
     # ── Section 12 — Trust feedback ──────────────────────────────
@@ -357,12 +593,12 @@ class SecureRouter:
         if gw is None:
             return False, "unknown_gateway"
 
-        # 3 — Verify gateway signature (Section 6)
-        full_hash = hashlib.sha256(
-            f"{req.client_id}|{req.gateway_id}|{req.payload}|{req.nonce}|{req.timestamp}".encode()
-        ).hexdigest()
-        expected_sig = sign(full_hash, gw._private_key)
-        if not hmac.compare_digest(req.signature_gateway, expected_sig):
+        # 3 — Verify gateway signature (Section 6). Recomputed from the
+        # request fields rather than trusting anything carried on it, so
+        # a payload altered after signing still fails.
+        request_hash = request_digest(req.payload, req.nonce, req.timestamp)
+        full_hash = gateway_digest(req.client_id, req.gateway_id, request_hash)
+        if not verify_keyed(full_hash, req.signature_gateway, gw._hmac):
             return False, "invalid_gateway_signature"
 
         # 4 — Origin enforcement (Section 7)
@@ -394,12 +630,12 @@ def build_client_request(
     """
     ts = timestamp or str(time.time())
     nc = nonce or secrets.token_hex(16)
-    data = hash_request(payload, nc, ts)
+    data = request_digest(payload, nc, ts)
 
     if forge_signature:
         sig = "forged_" + secrets.token_hex(16)
     else:
-        sig = sign(data, client._private_key)
+        sig = sign_keyed(data, client._hmac)
 
     return GatewayRequest(
         client_id=client.client_id,
@@ -28,7 +28,8 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from gateway import (
     Gateway, SecureRouter, ClientRegistry,
-    GatewayRequest, build_client_request, sign, hash_request,
+    ClientRecord, GatewayRequest, build_client_request, sign, hash_request,
+    generate_keypair,
 )
 
 # ═══════════════════════════════════════════════════════════════════
@@ -227,6 +228,12 @@ def test_region_not_allowed():
     assert not ok, "Unauthorized region was accepted"
     assert "region" in reason, f"Wrong reason: {reason}"
 
+    # Widening the allow-list after registration takes effect
+    client.allowed_regions = [*client.allowed_regions, "CN"]
+    req = build_client_request(client, payload="intl", region="CN")
+    ok, reason, _ = gw.process_request(req)
+    assert ok, f"Newly allowed region rejected: {reason}"
+
 
 def test_router_rejects_tampered_signature():
     """Router detects tampered gateway signature."""
@@ -258,6 +265,57 @@ def test_missing_fields_rejected():
     assert "missing" in reason, f"Wrong reason: {reason}"
 
 
+def test_future_timestamp_rejected():
+    """Section 10: far-future timestamps cannot outlive the nonce cache."""
+    reg, gw, router, client, _ = setup()
+    future_ts = str(time.time() + 600)
+    req = build_client_request(client, payload="later", timestamp=future_ts)
+    accepted, reason, _ = gw.process_request(req)
+    assert not accepted, "Future timestamp was accepted"
+    assert "timestamp" in reason, f"Wrong reason: {reason}"
+
+
+def test_batch_matches_sequential():
+    """process_batch shares replay state across the batch, in order."""
+    reg, gw, router, client, _ = setup()
+    fixed_nonce = secrets.token_hex(16)
+    reqs = [
+        build_client_request(client, payload="a", nonce=fixed_nonce),
+        build_client_request(client, payload="a", nonce=fixed_nonce),
+        build_client_request(client, payload="b"),
+    ]
+    results = gw.process_batch(reqs)
+    assert [ok for ok, _, _ in results] == [True, False, True], f"Got {results}"
+    assert results[1][1] == "replayed_nonce", f"Wrong reason: {results[1][1]}"
+    ok, reason = router.accept_request(results[2][2])
+    assert ok, f"Router rejected batched request: {reason}"
+
+
+def test_unslotted_record_rejected():
+    """A ClientRecord built outside register_client must not share slot -1's tables."""
+    reg, gw, _, client, _ = setup()
+    priv, pub = generate_keypair()
+    rogue = ClientRecord("C999", pub, priv, "GW-ALPHA")
+    reg._clients["C999"] = rogue
+    ok, reason, _ = gw.process_request(build_client_request(rogue, payload="x"))
+    assert not ok and reason == "unregistered_client", f"Got {ok}, {reason}"
+    ok, reason, _ = gw.process_request(build_client_request(client, payload="x"))
+    assert ok, f"Registered client affected: {reason}"
+
+
+def test_shared_prefix_nonces_accepted():
+    """Section 10: distinct nonces are distinct, even with a common prefix."""
+    reg, gw, router, client, _ = setup()
+    prefix = "deadbeefcafebabe"
+    for suffix in ("0", "1", "2"):
+        req = build_client_request(client, payload="p", nonce=prefix + suffix)
+        accepted, reason, _ = gw.process_request(req)
+        assert accepted, f"Nonce {prefix + suffix} rejected: {reason}"
+    req = build_client_request(client, payload="p", nonce=prefix + "1")
+    accepted, reason, _ = gw.process_request(req)
+    assert not accepted and reason == "replayed_nonce", f"Replay accepted: {reason}"
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  RUNNER
 # ═══════════════════════════════════════════════════════════════════
@@ -286,6 +344,10 @@ def run_all_gateway_tests():
     run_test("10. Region Not Allowed", test_region_not_allowed)
     run_test("11. Router Rejects Tampered Sig", test_router_rejects_tampered_signature)
     run_test("12. Missing Fields Rejected", test_missing_fields_rejected)
+    run_test("13. Batch Matches Sequential", test_batch_matches_sequential)
+    run_test("14. Future Timestamp Rejected", test_future_timestamp_rejected)
+    run_test("15. Shared-Prefix Nonces Accepted", test_shared_prefix_nonces_accepted)
+    run_test("16. Unslotted Record Rejected", test_unslotted_record_rejected)
 
     passed = sum(1 for _, ok, _ in _results if ok)
     failed = sum(1 for _, ok, _ in _results if not ok)
@@ -13,56 +13,182 @@ dynamic node insertion/deletion.
 """
 
 import random
-import math
 from typing import List, Optional, Dict, Tuple, Set
 from collections import deque
+from itertools import combinations
+
+import numpy as np
 
 from avrs.node import Node
-from avrs.math_utils import Vector, euclidean_distance
 
 
-# ═══════════════════════════════════════════════════════════════════
-#  GRAPH CONSTRUCTION (Section 3)
 # ═══════════════════════════════════════════════════════════════════
 #  GRAPH CONSTRUCTION (Section 2)
 # ═══════════════════════════════════════════════════════════════════
 
+# Above this dimensionality a KD-tree query is no faster than brute force
+KDTREE_MAX_DIM = 16
+
+
+def node_points(nodes: List[Node]) -> np.ndarray:
+    """
+    Stack node vectors into one contiguous (N, D) float64 matrix, row i
+    belonging to nodes[i]. Builders accept it so callers that already
+    hold the matrix (and fallbacks between modes) don't restack.
+    """
+    return np.array([n.vector for n in nodes], dtype=np.float64)
+
+
+def _squared_distances(origin: Node, others: List[Node]) -> np.ndarray:
+    """
+    Squared Euclidean distance from origin to each of others, in one
+    vectorized pass. Only used for ranking, so the sqrt is skipped.
+    """
+    diff = node_points(others)
+    diff -= np.asarray(origin.vector, dtype=np.float64)
+    return np.einsum("ij,ij->i", diff, diff)
+
+
+def _nearest(origin: Node, candidates: List[Node], k: int) -> List[Node]:
+    """The k candidates closest to origin, nearest first (ties keep order)."""
+    if not candidates or k <= 0:
+        return []
+    d = _squared_distances(origin, candidates)
+    return [candidates[i] for i in _rank_nearest(d, k).tolist()]
+
+
+def _rank_nearest(d: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k smallest values of d, smallest first (ties keep order)."""
+    if k < len(d):
+        # O(N) selection of the k smallest; the kth value decides which
+        # ties get in, taken in list order like a stable sort would
+        kth = d[np.argpartition(d, k - 1)[k - 1]]
+        below = np.flatnonzero(d < kth)
+        ties = np.flatnonzero(d == kth)[:k - len(below)]
+        idx = np.concatenate((below, ties))
+    else:
+        idx = np.arange(len(d))
+    return idx[np.lexsort((idx, d[idx]))]
+
+
 def generate_nodes(
     n_nodes: int,
     dimensions: int = 4,
     seed: Optional[int] = None,
     coord_range: Tuple[float, float] = (-1.0, 1.0),
 ) -> List[Node]:
-    """Create n_nodes with random vectors in the given coordinate range."""
-    if seed is not None:
-        random.seed(seed)
-    nodes = []
-    for i in range(n_nodes):
-        vec = [random.uniform(coord_range[0], coord_range[1]) for _ in range(dimensions)]
-        nodes.append(Node(node_id=f"N{i:03d}", vector=vec))
-    return nodes
+    """
+    Create n_nodes with random vectors in the given coordinate range.
+    All coordinates are drawn in one call to a seeded NumPy generator;
+    without a seed, the generator is seeded from the `random` module so
+    random.seed() still makes the output reproducible.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    rng = np.random.default_rng(seed)
+    coords = rng.uniform(coord_range[0], coord_range[1], size=(n_nodes, dimensions))
+    return [
+        Node(node_id=f"N{i:03d}", vector=vec)
+        for i, vec in enumerate(coords.tolist())
+    ]
 
 
-def build_knn_graph(nodes: List[Node], k: int = 5) -> List[Node]:
+def build_knn_graph(
+    nodes: List[Node], k: int = 5, points: Optional[np.ndarray] = None,
+) -> List[Node]:
     """
     MODE A — Nearest Neighbor Graph.
     Connect each node to K nearest neighbors. Edges are symmetric.
+
+    Low-dimensional point sets use a KD-tree query (scipy); high-D sets,
+    where KD-trees degrade, or installs without scipy use blocked GEMM
+    distances.
     """
-    for node in nodes:
-        distances = []
-        for other in nodes:
-            if other.id == node.id:
+    if len(nodes) < 2 or k <= 0:
+        return nodes
+    if points is None:
+        points = node_points(nodes)
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        cKDTree = None
+
+    if cKDTree is not None and points.shape[1] <= KDTREE_MAX_DIM:
+        # k+1 so the node itself (distance 0) can be dropped from each row
+        _, idx = cKDTree(points).query(points, k=min(k + 1, len(nodes)), workers=-1)
+        rows = idx.tolist()
+    else:
+        rows = _knn_rows_gemm(points, k + 1)
+
+    n_nodes = len(nodes)
+    for i, row in enumerate(rows):
+        node = nodes[i]
+        picked = 0
+        for j in row:
+            if j == i or j >= n_nodes or nodes[j].id == node.id:
                 continue
-            dist = euclidean_distance(list(node.vector), list(other.vector))
-            distances.append((dist, other))
-        distances.sort(key=lambda x: x[0])
-        for _, neighbor in distances[:k]:
+            neighbor = nodes[j]
             node.add_neighbor(neighbor)
             neighbor.add_neighbor(node)  # symmetric
+            picked += 1
+            if picked == k:
+                break
     return nodes
 
 
-def build_delaunay_graph(nodes: List[Node]) -> Tuple[List[Node], str]:
+def _knn_rows_gemm(points: np.ndarray, k: int, block: int = 1024) -> List[List[int]]:
+    """
+    Indices of each point's k nearest points (itself included), nearest
+    first, ties in index order.
+
+    Candidates come from ‖x‖² + ‖y‖² − 2·x·y, one GEMM per block of
+    rows. Only their ranking matters, so the GEMM runs on centered
+    float32 copies (half the memory traffic of float64); a few spare
+    candidates are then re-ranked on exact float64 distances so rounding
+    error cannot reorder near-ties.
+    """
+    n = len(points)
+    k = min(k, n)
+    take = min(k + 4, n)
+    low = (points - points.mean(axis=0)).astype(np.float32)
+    sq = np.einsum("ij,ij->i", low, low)
+    rows: List[List[int]] = []
+    for start in range(0, n, block):
+        blk = points[start:start + block]
+        d = low[start:start + block] @ low.T
+        d *= -2.0
+        d += sq[start:start + block, None]
+        d += sq[None, :]
+        if take < n:
+            cand = np.argpartition(d, take - 1, axis=1)[:, :take]
+        else:
+            cand = np.broadcast_to(np.arange(n), (len(blk), n))
+        for r in range(len(blk)):
+            c = cand[r]
+            diff = points[c] - blk[r]
+            exact = np.einsum("ij,ij->i", diff, diff)
+            rows.append(c[np.lexsort((c, exact))][:k].tolist())
+    return rows
+
+
+def simplex_edges(simplices: np.ndarray) -> np.ndarray:
+    """
+    Unique undirected edges (a < b) of a triangulation, as an (E, 2)
+    array: every vertex pair of every simplex, sorted and deduplicated.
+    """
+    pairs = np.array(list(combinations(range(simplices.shape[1]), 2)))
+    edges = simplices[:, pairs].reshape(-1, 2).astype(np.int64)
+    edges.sort(axis=1)
+    # Dedup on one scalar key per edge: a flat np.unique is much faster
+    # than the row-wise axis=0 variant, and a*n+b keeps (a, b) order
+    n = int(edges[:, 1].max()) + 1 if len(edges) else 1
+    keys = np.unique(edges[:, 0] * n + edges[:, 1])
+    return np.stack((keys // n, keys % n), axis=1)
+
+
+def build_delaunay_graph(
+    nodes: List[Node], points: Optional[np.ndarray] = None,
+) -> Tuple[List[Node], str]:
     """
     MODE B — Delaunay Triangulation Graph.
     Returns (nodes, topology_mode) where topology_mode is "delaunay" or "knn" (fallback).
@@ -73,7 +199,6 @@ def build_delaunay_graph(nodes: List[Node]) -> Tuple[List[Node], str]:
       - degenerate point configuration
     """
     try:
-        import numpy as np
         from scipy.spatial import Delaunay
     except ImportError:
         print("  [WARN] scipy not available — falling back to KNN")
@@ -90,25 +215,18 @@ def build_delaunay_graph(nodes: List[Node]) -> Tuple[List[Node], str]:
         build_knn_graph(nodes, k=min(5, len(nodes) - 1))
         return nodes, "knn"
 
-    points = np.array([list(n.vector) for n in nodes])
+    if points is None:
+        points = node_points(nodes)
 
     try:
         tri = Delaunay(points)
     except Exception as e:
         print(f"  [WARN] Delaunay failed ({e}) — falling back to KNN")
-        build_knn_graph(nodes, k=5)
+        build_knn_graph(nodes, k=5, points=points)
         return nodes, "knn"
 
-    # Extract unique edges from all simplices
-    edge_set: Set[Tuple[int, int]] = set()
-    for simplex in tri.simplices:
-        for i in range(len(simplex)):
-            for j in range(i + 1, len(simplex)):
-                a, b = simplex[i], simplex[j]
-                edge_set.add((min(a, b), max(a, b)))
-
     # Create bidirectional links
-    for a_idx, b_idx in edge_set:
+    for a_idx, b_idx in simplex_edges(tri.simplices).tolist():
         nodes[a_idx].add_neighbor(nodes[b_idx])
         nodes[b_idx].add_neighbor(nodes[a_idx])
 
@@ -146,10 +264,14 @@ def validate_graph(nodes: List[Node]) -> Dict[str, any]:
             results["no_isolated"] = False
             results["errors"].append(f"Isolated node: {node.id}")
 
-    # Check symmetry: if A→B then B→A
+    # Check symmetry: if A→B then B→A (set lookups instead of list scans)
+    neighbor_sets = {node: set(node.neighbors) for node in nodes}
     for node in nodes:
         for neighbor in node.neighbors:
-            if node not in neighbor.neighbors:
+            reverse = neighbor_sets.get(neighbor)
+            if reverse is None:
+                reverse = neighbor_sets[neighbor] = set(neighbor.neighbors)
+            if node not in reverse:
                 results["symmetric_edges"] = False
                 results["errors"].append(
                     f"Asymmetric edge: {node.id}→{neighbor.id} but not reverse"
@@ -158,19 +280,11 @@ def validate_graph(nodes: List[Node]) -> Dict[str, any]:
     # Check connectivity via BFS (note: BFS is for validation only, NOT for routing)
     alive_nodes = [n for n in nodes if n.alive]
     if alive_nodes:
-        visited = set()
-        queue = deque([alive_nodes[0]])
-        visited.add(alive_nodes[0].id)
-        while queue:
-            current = queue.popleft()
-            for nb in current.neighbors:
-                if nb.id not in visited and nb.alive:
-                    visited.add(nb.id)
-                    queue.append(nb)
-        results["connected"] = len(visited) == len(alive_nodes)
+        reached = _count_reachable(alive_nodes)
+        results["connected"] = reached == len(alive_nodes)
         if not results["connected"]:
             results["errors"].append(
-                f"Graph not connected: {len(visited)}/{len(alive_nodes)} reachable"
+                f"Graph not connected: {reached}/{len(alive_nodes)} reachable"
             )
 
     # Sparse check: average degree < n (relaxed for high-D Delaunay)
@@ -180,6 +294,85 @@ def validate_graph(nodes: List[Node]) -> Dict[str, any]:
     return results
 
 
+def _adjacency(nodes: List[Node], alive_only: bool = False):
+    """
+    CSR adjacency over nodes (by id), plus any neighbors reachable from
+    them that are not in the list. Row i is the i-th distinct node.
+    With alive_only, edges touching a failed node are masked out in one
+    vectorized pass over the edge arrays rather than tested per edge.
+    """
+    from scipy.sparse import csr_matrix
+
+    index: Dict[str, int] = {}
+    order: List[Node] = []
+    for n in nodes:
+        if n.id not in index:
+            index[n.id] = len(order)
+            order.append(n)
+    rows: List[int] = []
+    cols: List[int] = []
+    i = 0
+    while i < len(order):  # order grows as outside neighbors turn up
+        for nb in order[i].neighbors:
+            j = index.get(nb.id)
+            if j is None:
+                j = index[nb.id] = len(order)
+                order.append(nb)
+            rows.append(i)
+            cols.append(j)
+        i += 1
+    size = len(order)
+    rows = np.array(rows, dtype=np.int64)
+    cols = np.array(cols, dtype=np.int64)
+    if alive_only:
+        alive = np.fromiter((n.alive for n in order), dtype=bool, count=size)
+        keep = alive[rows] & alive[cols]
+        rows, cols = rows[keep], cols[keep]
+    data = np.ones(len(rows), dtype=np.int8)
+    return csr_matrix((data, (rows, cols)), shape=(size, size))
+
+
+def _count_reachable(alive_nodes: List[Node]) -> int:
+    """Nodes reachable from alive_nodes[0] along alive neighbor links."""
+    try:
+        from scipy.sparse.csgraph import breadth_first_order
+    except ImportError:
+        visited = {alive_nodes[0].id}
+        queue = deque([alive_nodes[0]])
+        while queue:
+            current = queue.popleft()
+            for nb in current.neighbors:
+                if nb.id not in visited and nb.alive:
+                    visited.add(nb.id)
+                    queue.append(nb)
+        return len(visited)
+    adj = _adjacency(alive_nodes, alive_only=True)
+    return len(breadth_first_order(adj, 0, directed=True, return_predecessors=False))
+
+
+def _count_components(nodes: List[Node]) -> int:
+    """Number of (weakly) connected components in the neighbor graph."""
+    try:
+        from scipy.sparse.csgraph import connected_components
+    except ImportError:
+        visited: Set[str] = set()
+        components = 0
+        for node in nodes:
+            if node.id not in visited:
+                components += 1
+                queue = deque([node])
+                visited.add(node.id)
+                while queue:
+                    curr = queue.popleft()
+                    for nb in curr.neighbors:
+                        if nb.id not in visited:
+                            visited.add(nb.id)
+                            queue.append(nb)
+        return components
+    count, _ = connected_components(_adjacency(nodes), directed=True, connection="weak")
+    return count
+
+
 def graph_diagnostics(nodes: List[Node]) -> Dict[str, float]:
     """
     Compute topology diagnostics:
@@ -195,36 +388,31 @@ def graph_diagnostics(nodes: List[Node]) -> Dict[str, float]:
     avg_degree = sum(degrees) / len(nodes)
 
     # Clustering coefficient (proportion of neighbor pairs that are also connected)
+    neighbor_id_sets: Dict[str, Set[str]] = {}
+
+    def neighbor_ids(n: Node) -> Set[str]:
+        ids = neighbor_id_sets.get(n.id)
+        if ids is None:
+            ids = neighbor_id_sets[n.id] = {nb.id for nb in n.neighbors}
+        return ids
+
     cc_values = []
     for node in nodes:
         k = len(node.neighbors)
         if k < 2:
             cc_values.append(0.0)
             continue
-        neighbor_ids = {n.id for n in node.neighbors}
+        # Pairs (ni, nj) with nj after ni in the list and nj ∈ ni.neighbors
+        ids = [nb.id for nb in node.neighbors]
         triangles = 0
         for i, ni in enumerate(node.neighbors):
-            for nj in node.neighbors[i + 1:]:
-                if nj.id in {nb.id for nb in ni.neighbors}:
-                    triangles += 1
+            triangles += len(neighbor_ids(ni).intersection(ids[i + 1:]))
         possible = k * (k - 1) / 2
         cc_values.append(triangles / possible if possible > 0 else 0.0)
     clustering_coefficient = sum(cc_values) / len(cc_values)
 
     # Component count
-    visited: Set[str] = set()
-    components = 0
-    for node in nodes:
-        if node.id not in visited:
-            components += 1
-            queue = deque([node])
-            visited.add(node.id)
-            while queue:
-                curr = queue.popleft()
-                for nb in curr.neighbors:
-                    if nb.id not in visited:
-                        visited.add(nb.id)
-                        queue.append(nb)
+    components = _count_components(nodes)
 
     return {
         "average_degree": round(avg_degree, 2),
@@ -237,54 +425,224 @@ def graph_diagnostics(nodes: List[Node]) -> Dict[str, float]:
 #  SELF-HEALING NETWORK (Section 12)
 # ═══════════════════════════════════════════════════════════════════
 
-def heal_around_failure(failed_node: Node, all_nodes: List[Node], k: int = 3) -> int:
+class GraphIndex:
+    """
+    Persistent spatial index over node vectors for incremental updates.
+
+    Built once (e.g. right after graph construction) and reused by
+    insert_node, so each insertion is a KD-tree query instead of a scan
+    over every node. Inserted nodes are kept in a small pending tail that
+    is scanned directly; the tree is rebuilt once the tail outgrows
+    sqrt(N). Failed nodes stay in the tree and are filtered out at query
+    time — call rebuild() after bulk changes such as rebuild_topology().
+    Without scipy, or above KDTREE_MAX_DIM, queries fall back to a scan.
+    """
+
+    def __init__(self, nodes: List[Node], points: Optional[np.ndarray] = None):
+        self.nodes: List[Node] = list(nodes)
+        self.points = node_points(self.nodes) if points is None else points
+        self.tree = None
+        self._indexed = 0
+        self.rebuild(self.points)
+
+    def rebuild(self, points: Optional[np.ndarray] = None) -> None:
+        """Re-index every node, folding the pending tail into the tree."""
+        if points is None:
+            points = node_points(self.nodes)
+        self.points = points
+        self._indexed = len(self.nodes)
+        self.tree = None
+        if self._indexed and points.shape[1] <= KDTREE_MAX_DIM:
+            try:
+                from scipy.spatial import cKDTree
+            except ImportError:
+                return
+            self.tree = cKDTree(points)
+
+    def add(self, node: Node) -> None:
+        self.nodes.append(node)
+        pending = len(self.nodes) - self._indexed
+        if pending * pending > len(self.nodes):
+            self.rebuild()
+
+    def nearest(self, origin: Node, k: int) -> List[Node]:
+        """The k alive nodes (other than origin) closest to it, nearest first."""
+        if k <= 0:
+            return []
+        if self.tree is None:
+            candidates = [
+                n for n in self.nodes if n.alive and n.id != origin.id
+            ]
+            return _nearest(origin, candidates, k)
+
+        n_tree = self._indexed
+        q = min(n_tree, k + 8)
+        while True:
+            _, idx = self.tree.query(origin.vector, k=q)
+            idx = np.atleast_1d(idx)
+            hits = [
+                i for i in idx.tolist()
+                if i < n_tree and self.nodes[i].alive
+                and self.nodes[i].id != origin.id
+            ]
+            # Dead or excluded rows may crowd the first q; widen until
+            # k usable nodes are found or the tree is exhausted
+            if len(hits) >= k or q >= n_tree:
+                break
+            q = min(n_tree, q * 2)
+        hits.sort()
+        candidates = [self.nodes[i] for i in hits]
+        candidates.extend(
+            n for n in self.nodes[n_tree:] if n.alive and n.id != origin.id
+        )
+        return _nearest(origin, candidates, k)
+
+
+class DisjointSet:
+    """
+    Union-find over node ids for incremental connectivity tracking.
+
+    Edge additions (healing, insertion) are merged in near-constant time,
+    so component_count() stays current without a full traversal. Unions
+    cannot be undone: after failures or removals, rebuild the structure
+    with from_nodes() — typically alongside rebuild_topology().
+    """
+
+    def __init__(self):
+        self._parent: Dict[str, str] = {}
+        self._size: Dict[str, int] = {}
+        self._components = 0
+
+    @classmethod
+    def from_nodes(cls, nodes: List[Node], alive_only: bool = True) -> "DisjointSet":
+        dsu = cls()
+        members = [n for n in nodes if n.alive] if alive_only else list(nodes)
+        for node in members:
+            dsu.add(node.id)
+        for node in members:
+            for nb in node.neighbors:
+                if nb.id in dsu._parent:
+                    dsu.union(node.id, nb.id)
+        return dsu
+
+    def add(self, node_id: str) -> None:
+        if node_id not in self._parent:
+            self._parent[node_id] = node_id
+            self._size[node_id] = 1
+            self._components += 1
+
+    def find(self, node_id: str) -> str:
+        parent = self._parent
+        root = node_id
+        while parent[root] != root:
+            root = parent[root]
+        # Path compression
+        while parent[node_id] != root:
+            parent[node_id], node_id = root, parent[node_id]
+        return root
+
+    def union(self, a: str, b: str) -> bool:
+        """Merge the sets of a and b. Returns True if they were disjoint."""
+        self.add(a)
+        self.add(b)
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        if self._size[ra] < self._size[rb]:
+            ra, rb = rb, ra
+        self._parent[rb] = ra
+        self._size[ra] += self._size.pop(rb)
+        self._components -= 1
+        return True
+
+    def connected(self, a: str, b: str) -> bool:
+        return self.find(a) == self.find(b)
+
+    def component_count(self) -> int:
+        return self._components
+
+
+def heal_around_failure(
+    failed_node: Node,
+    all_nodes: List[Node],
+    k: int = 3,
+    components: Optional[DisjointSet] = None,
+) -> int:
     """
     When a node fails, its neighbors locally repair the topology.
     Each neighbor of the failed node connects to the k nearest OTHER
     neighbors of the failed node that it wasn't already connected to.
+    New edges are merged into `components` when given.
 
     Returns number of new edges created.
     """
     new_edges = 0
     neighbors_of_failed = [n for n in failed_node.neighbors if n.alive]
-
-    for node in neighbors_of_failed:
-        # Find other alive neighbors of the failed node
-        candidates = [
-            n for n in neighbors_of_failed
-            if n.id != node.id and n not in node.neighbors
+    if len(neighbors_of_failed) < 2 or k <= 0:
+        return 0
+    # All pairwise squared distances among the survivors, computed once
+    pts = node_points(neighbors_of_failed)
+    diff = pts[None, :, :] - pts[:, None, :]
+    pair_d = np.einsum("ijk,ijk->ij", diff, diff)
+
+    for i, node in enumerate(neighbors_of_failed):
+        # Find other alive neighbors of the failed node (edges added for
+        # earlier survivors count, so membership is checked per node)
+        linked = set(node.neighbors)
+        cols = [
+            j for j, n in enumerate(neighbors_of_failed)
+            if n.id != node.id and n not in linked
         ]
-        # Sort by distance and connect to closest k
-        candidates.sort(
-            key=lambda c: euclidean_distance(list(node.vector), list(c.vector))
-        )
-        for candidate in candidates[:k]:
+        if not cols:
+            continue
+        # Connect to the closest k
+        for pos in _rank_nearest(pair_d[i, cols], k).tolist():
+            candidate = neighbors_of_failed[cols[pos]]
             node.add_neighbor(candidate)
             candidate.add_neighbor(node)
+            if components is not None:
+                components.union(node.id, candidate.id)
             new_edges += 1
 
     return new_edges
 
 
-def insert_node(new_node: Node, all_nodes: List[Node], k: int = 5) -> None:
+def insert_node(
+    new_node: Node,
+    all_nodes: List[Node],
+    k: int = 5,
+    components: Optional[DisjointSet] = None,
+    index: Optional[GraphIndex] = None,
+) -> None:
     """
     Insert a new node and connect it to k nearest existing alive nodes.
+    New edges are merged into `components` when given. With an `index`
+    covering all_nodes, the neighbor search is a spatial query rather
+    than a full scan, and the new node is added to the index.
     """
-    candidates = [
-        n for n in all_nodes if n.alive and n.id != new_node.id
-    ]
-    candidates.sort(
-        key=lambda c: euclidean_distance(list(new_node.vector), list(c.vector))
-    )
-    for neighbor in candidates[:k]:
+    if index is not None:
+        nearest = index.nearest(new_node, k)
+        index.add(new_node)
+    else:
+        candidates = [
+            n for n in all_nodes if n.alive and n.id != new_node.id
+        ]
+        nearest = _nearest(new_node, candidates, k)
+    if components is not None:
+        components.add(new_node.id)
+    for neighbor in nearest:
         new_node.add_neighbor(neighbor)
         neighbor.add_neighbor(new_node)
+        if components is not None:
+            components.union(new_node.id, neighbor.id)
     all_nodes.append(new_node)
 
 
 def remove_node(node: Node, all_nodes: List[Node], heal: bool = True) -> None:
     """
     Remove a node: mark as failed, optionally heal the neighborhood.
+    Removal can split components, so any DisjointSet tracking this graph
+    must be rebuilt with DisjointSet.from_nodes() afterwards.
     """
     node.fail()
     if heal:
@@ -298,7 +656,7 @@ def rebuild_topology(nodes: List[Node], mode: str = "knn", k: int = 5) -> str:
     """
     # Clear all neighbor lists
     for node in nodes:
-        node.neighbors = []
+        node.clear_neighbors()
 
     alive_nodes = [n for n in nodes if n.alive]
 
@@ -8,24 +8,42 @@ Stores logs and forwards them to the AI analyzer.
 """
 
 import docker
-from typing import Optional, Dict
+from docker.models.containers import Container
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List
 
 
 class LogCollector:
     """Fetches and stores container logs from real Docker containers."""
 
-    def __init__(self):
-        self.client = docker.from_env()
-        self.log_store: Dict[str, str] = {}
+    def __init__(self, client: Optional[docker.DockerClient] = None):
+        self.client = client or docker.from_env()
+        # Raw log bytes by name; decoded only when (and as far as) read
+        self.log_store_raw: Dict[str, bytes] = {}
+        # Container handles by name; saves a daemon lookup per fetch
+        self._container_cache: Dict[str, Container] = {}
+
+    def _container(self, container_name: str) -> Container:
+        container = self._container_cache.get(container_name)
+        if container is None:
+            container = self.client.containers.get(container_name)
+            self._container_cache[container_name] = container
+        return container
 
     def fetch_logs(self, container_name: str, tail: int = 50) -> str:
         """Fetch the last N lines of logs from a container."""
         try:
-            container = self.client.containers.get(container_name)
-            logs = container.logs(tail=tail, timestamps=True).decode("utf-8", errors="replace")
-            self.log_store[container_name] = logs
-            return logs
+            container = self._container(container_name)
+            try:
+                raw = container.logs(tail=tail, timestamps=True)
+            except docker.errors.NotFound:
+                # Cached handle is stale (container recreated under the same name)
+                self._container_cache.pop(container_name, None)
+                raw = self._container(container_name).logs(tail=tail, timestamps=True)
+            self.log_store_raw[container_name] = raw
+            return raw.decode("utf-8", errors="replace")
         except docker.errors.NotFound:
+            self._container_cache.pop(container_name, None)
             return f"[ERROR] Container '{container_name}' not found"
         except docker.errors.APIError as e:
             return f"[ERROR] Docker API error: {str(e)[:200]}"
@@ -37,17 +55,34 @@ class LogCollector:
         try:
             service = self.client.services.get(service_name)
             logs = service.logs(tail=tail, timestamps=True, stdout=True, stderr=True)
-            if isinstance(logs, bytes):
-                log_text = logs.decode("utf-8", errors="replace")
-            else:
-                log_text = "".join(chunk.decode("utf-8", errors="replace") for chunk in logs)
-            self.log_store[service_name] = log_text
-            return log_text
+            raw = logs if isinstance(logs, bytes) else b"".join(logs)
+            self.log_store_raw[service_name] = raw
+            return raw.decode("utf-8", errors="replace")
         except Exception as e:
             return f"[ERROR] Could not fetch service logs: {str(e)[:200]}"
 
+    def fetch_many(self, names: List[str], tail: int = 50,
+                   services: bool = False) -> Dict[str, str]:
+        """
+        Fetch logs for several containers (or services) concurrently.
+
+        Each fetch is a blocking Docker API call, so running them on a
+        thread pool costs roughly the slowest call instead of the sum.
+        Failures come back as the same "[ERROR] ..." strings as the
+        single-name fetchers.
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return {}
+        fetch = self.fetch_service_logs if services else self.fetch_logs
+        with ThreadPoolExecutor(max_workers=min(32, len(names))) as pool:
+            return dict(zip(names, pool.map(lambda n: fetch(n, tail), names)))
+
     def get_stored_logs(self, name: str) -> Optional[str]:
-        return self.log_store.get(name)
+        raw = self.log_store_raw.get(name)
+        return None if raw is None else raw.decode("utf-8", errors="replace")
 
     def get_all_stored(self) -> Dict[str, str]:
-        return {k: v[:500] for k, v in self.log_store.items()}
+        """Previews of every stored log: first 500 bytes, decoded."""
+        return {k: v[:500].decode("utf-8", errors="replace")
+                for k, v in self.log_store_raw.items()}
@@ -12,7 +12,8 @@ Principle: Each node is a point in vector space. Routing moves toward
 
 import sys
 import os
-import random
+
+import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -22,7 +23,7 @@ from graph_builder import (
     generate_nodes, build_knn_graph, build_delaunay_graph,
     validate_graph, graph_diagnostics,
 )
-from topology_engine import greedy_guarantee_check
+from topology_engine import greedy_guarantee_check_batch
 from routing_engine import RoutingEngine
 from simulator import Simulator, Request
 from tests import run_all_tests
@@ -56,12 +57,11 @@ def demo_knn_mode():
 
     # Run 5 sample routes
     print("\n  Sample Routes:")
-    rng = random.Random(42)
-    for i in range(5):
-        start = nodes[rng.randint(0, len(nodes) - 1)]
-        target = [rng.uniform(-0.5, 0.5) for _ in range(4)]
-        req = Request(target_vector=target, sender_id=f"demo-{i}")
-        result = sim.route_request(start, req)
+    rng = np.random.default_rng(42)
+    starts = [nodes[i] for i in rng.integers(0, len(nodes), size=5).tolist()]
+    targets = rng.uniform(-0.5, 0.5, size=(5, 4)).tolist()
+    reqs = [Request(target_vector=t, sender_id=f"demo-{i}") for i, t in enumerate(targets)]
+    for i, result in enumerate(sim.route_requests(starts, reqs)):
         status = "✓" if result.success else "✗"
         path_str = " → ".join(result.path)
         print(f"    {status} Route {i+1}: {path_str}  (hops={result.total_hops})")
@@ -86,12 +86,9 @@ def demo_delaunay_mode():
     print(f"  Components: {diag['component_count']}")
 
     # Greedy guarantee check
-    rng = random.Random(42)
-    total_violations = 0
-    for _ in range(10):
-        target = [rng.uniform(-1, 1) for _ in range(4)]
-        gg = greedy_guarantee_check(nodes, target)
-        total_violations += len(gg["violations"])
+    rng = np.random.default_rng(42)
+    checks = greedy_guarantee_check_batch(nodes, rng.uniform(-1, 1, size=(10, 4)))
+    total_violations = sum(len(gg["violations"]) for gg in checks)
     print(f"  Greedy Violations (10 targets): {total_violations}")
 
     engine = RoutingEngine(use_cache=True, use_face_routing=True)
@@ -99,12 +96,11 @@ def demo_delaunay_mode():
 
     # Run 5 sample routes with detailed logging
     print("\n  Sample Routes:")
-    rng = random.Random(42)
-    for i in range(5):
-        start = nodes[rng.randint(0, len(nodes) - 1)]
-        target = [rng.uniform(-0.5, 0.5) for _ in range(4)]
-        req = Request(target_vector=target, sender_id=f"demo-{i}")
-        result = sim.route_request(start, req)
+    rng = np.random.default_rng(42)
+    starts = [nodes[i] for i in rng.integers(0, len(nodes), size=5).tolist()]
+    targets = rng.uniform(-0.5, 0.5, size=(5, 4)).tolist()
+    reqs = [Request(target_vector=t, sender_id=f"demo-{i}") for i, t in enumerate(targets)]
+    for i, result in enumerate(sim.route_requests(starts, reqs)):
         status = "✓" if result.success else "✗"
         path_str = " → ".join(result.path)
         print(f"    {status} Route {i+1}: {path_str}  (hops={result.total_hops})")
@@ -9,36 +9,86 @@ Tracks per-pod and per-service metrics over time.
 """
 
 import time
+import random
 import threading
-from typing import List, Dict, Optional
-from collections import defaultdict
+from typing import List, Dict, Optional, Deque
+from collections import defaultdict, deque
+from itertools import islice
+from concurrent.futures import CancelledError, ThreadPoolExecutor, TimeoutError as FutureTimeout
+import numpy as np
 from controller.cluster import Cluster, Pod, PodStatus
 
 
+class _LatencyWindow:
+    """
+    Running sum of healthy-check latencies over the last `size` checks.
+
+    Latencies arrive rounded to 0.1 ms and are summed as integer tenths,
+    so the sum stays exact however many checks slide through.
+    """
+
+    def __init__(self, size: int):
+        self._window: Deque[int] = deque(maxlen=size)  # tenths, -1 = unhealthy
+        self.total_tenths = 0
+        self.healthy = 0
+
+    def push(self, healthy: bool, latency_ms: float):
+        window = self._window
+        if len(window) == window.maxlen:
+            oldest = window[0]
+            if oldest >= 0:
+                self.total_tenths -= oldest
+                self.healthy -= 1
+        tenths = round(latency_ms * 10) if healthy else -1
+        window.append(tenths)
+        if tenths >= 0:
+            self.total_tenths += tenths
+            self.healthy += 1
+
+    def mean(self) -> float:
+        if not self.healthy:
+            return 0.0
+        return round(self.total_tenths / self.healthy / 10, 1)
+
+
 class HealthRecord:
     """Time-series health record for a single pod."""
 
     def __init__(self, pod_name: str, max_history: int = 100):
         self.pod_name = pod_name
-        self.checks: List[Dict] = []
+        # Bounded history: appends evict the oldest entry in O(1)
+        self.checks: Deque[Dict] = deque(maxlen=max_history)
         self.max_history = max_history
         self.total_checks = 0
         self.total_healthy = 0
         self.total_unhealthy = 0
+        # Windows behind avg_latency and the cluster summary's average
+        self.window20 = _LatencyWindow(min(20, max_history))
+        self.window5 = _LatencyWindow(min(5, max_history))
+        # to_dict() view, rebuilt on the first read after a record()
+        self._view: Optional[dict] = None
 
     def record(self, healthy: bool, latency_ms: float):
+        self._view = None
         self.total_checks += 1
         if healthy:
             self.total_healthy += 1
         else:
             self.total_unhealthy += 1
+        latency_ms = round(latency_ms, 1)
         self.checks.append({
             "timestamp": time.time(),
             "healthy": healthy,
-            "latency_ms": round(latency_ms, 1),
+            "latency_ms": latency_ms,
         })
-        if len(self.checks) > self.max_history:
-            self.checks = self.checks[-self.max_history:]
+        self.window20.push(healthy, latency_ms)
+        self.window5.push(healthy, latency_ms)
+
+    def recent(self, n: int) -> List[Dict]:
+        """The last n checks, oldest first."""
+        latest = list(islice(reversed(self.checks), n))
+        latest.reverse()
+        return latest
 
     @property
     def uptime_pct(self) -> float:
@@ -48,17 +98,19 @@ class HealthRecord:
 
     @property
     def avg_latency(self) -> float:
-        recent = [c["latency_ms"] for c in self.checks[-20:] if c["healthy"]]
-        return round(sum(recent) / len(recent), 1) if recent else 0.0
+        return self.window20.mean()
 
     def to_dict(self) -> dict:
-        return {
-            "pod_name": self.pod_name,
-            "total_checks": self.total_checks,
-            "uptime_pct": self.uptime_pct,
-            "avg_latency_ms": self.avg_latency,
-            "recent": self.checks[-10:],
-        }
+        """Cached between checks; callers must treat it as read-only."""
+        if self._view is None:
+            self._view = {
+                "pod_name": self.pod_name,
+                "total_checks": self.total_checks,
+                "uptime_pct": self.uptime_pct,
+                "avg_latency_ms": self.avg_latency,
+                "recent": self.recent(10),
+            }
+        return self._view
 
 
 class HealthChecker:
@@ -66,15 +118,36 @@ class HealthChecker:
     Periodically polls pod /health endpoints and tracks metrics.
 
     Runs in a background thread. Results are queryable via API.
+
+    With max_workers > 0 the per-pod probes fan out over a thread pool
+    (started by start()), so a cycle costs about the slowest probe rather
+    than the sum; a probe that outlasts the interval is counted unhealthy.
+    The default of 0 probes inline, which is cheaper while checks are
+    simulated in memory. A cycle caught by stop() shutting the pool down
+    is abandoned without recording anything.
+
+    Simulated latencies come from a generator seeded with `seed`, or
+    from the `random` module's state when no seed is given.
     """
 
-    def __init__(self, cluster: Cluster, interval: float = 3.0):
+    MAX_WORKERS = 32
+
+    def __init__(
+        self,
+        cluster: Cluster,
+        interval: float = 3.0,
+        max_workers: int = 0,
+        seed: Optional[int] = None,
+    ):
         self.cluster = cluster
         self.interval = interval
+        self.max_workers = min(max_workers, self.MAX_WORKERS)
+        self._pool: Optional[ThreadPoolExecutor] = None
         self.records: Dict[str, HealthRecord] = {}
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self.last_check_time = 0.0
+        self._rng = np.random.default_rng(seed if seed is not None else random.getrandbits(64))
         # Service-level aggregates
         self.service_metrics: Dict[str, Dict] = defaultdict(lambda: {
             "total_requests": 0,
@@ -86,13 +159,34 @@ class HealthChecker:
     def check_all(self):
         """Run health checks on every pod in the cluster."""
         self.last_check_time = time.time()
-        for pod in self.cluster.all_pods():
+        pods = self.cluster.all_pods()
+        # One batched draw for every pod's simulated latency
+        latencies = self._rng.uniform(*Pod.SPIKE_LATENCY_RANGE, size=len(pods)).tolist()
+        pool = self._pool
+        if pool is not None and pods:
+            deadline = self.last_check_time + self.interval
+            try:
+                futures = [pool.submit(pod.check_health, drawn)
+                           for pod, drawn in zip(pods, latencies)]
+            except RuntimeError:
+                return  # stop() shut the pool down before we submitted
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result(timeout=max(0.0, deadline - time.time())))
+                except FutureTimeout:
+                    future.cancel()
+                    results.append(False)
+                except CancelledError:
+                    return  # stop() cancelled the queued probes
+        else:
+            # Run simulated health checks inline
+            results = [pod.check_health(drawn) for pod, drawn in zip(pods, latencies)]
+
+        for pod, healthy in zip(pods, results):
             # Get or create record
             if pod.name not in self.records:
                 self.records[pod.name] = HealthRecord(pod.name)
-
-            # Run simulated health check
-            healthy = pod.check_health()
             latency = pod.latency_ms if healthy else 0.0
             self.records[pod.name].record(healthy, latency)
 
@@ -110,19 +204,21 @@ class HealthChecker:
         healthy = sum(1 for p in all_pods if p.health_ok and p.status == PodStatus.RUNNING)
         unhealthy = total - healthy
 
-        all_latencies = []
+        # Mean over every pod's healthy checks among its last 5
+        total_tenths = 0
+        count = 0
         for rec in self.records.values():
-            recent = [c["latency_ms"] for c in rec.checks[-5:] if c["healthy"]]
-            all_latencies.extend(recent)
+            total_tenths += rec.window5.total_tenths
+            count += rec.window5.healthy
 
-        avg_latency = round(sum(all_latencies) / len(all_latencies), 1) if all_latencies else 0.0
+        avg_latency = round(total_tenths / count / 10, 1) if count else 0.0
 
         # Per-node health
         node_health = {}
         for node in self.cluster.nodes:
             running = sum(1 for p in node.pods if p.status == PodStatus.RUNNING and p.health_ok)
             node_health[node.name] = {
-                "status": node.status.value,
+                "status": node.status.label,
                 "healthy_pods": running,
                 "total_pods": node.pod_count,
             }
@@ -141,11 +237,17 @@ class HealthChecker:
 
     def start(self):
         self._running = True
+        if self.max_workers > 0 and self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="health-probe")
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
 
     def stop(self):
         self._running = False
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
 
     def _run_loop(self):
         while self._running:
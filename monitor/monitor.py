@@ -3,38 +3,51 @@
   DOCKER HEALTH MONITOR — Real Container Monitoring via Docker SDK
 ═══════════════════════════════════════════════════════════════════════
 
-Polls real Docker containers using the Docker socket.
+Watches real Docker containers using the Docker socket.
 Detects crashes, restarts, unhealthy state, and timeouts.
+
+The background thread is event-driven: it follows the daemon's container
+event stream and re-checks only the container that changed, probes the
+HTTP health endpoints every check_interval seconds, and runs a full
+check_all() every resync_interval seconds as a reconciliation pass.
 """
 
 import time
+import queue
 import threading
 import docker
 import urllib.request
 import json
-from typing import List, Dict, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Callable, Tuple
 
 
 class ContainerState:
     """Snapshot of a container's state at a point in time."""
 
-    def __init__(self, container):
+    def __init__(self, container, image: Optional[str] = None):
+        """
+        Built from already-inspected attrs; no daemon calls are made here
+        unless `image` is omitted, in which case the image is looked up.
+        """
+        attrs = container.attrs
+        state = attrs.get("State") or {}
+        labels = container.labels
         self.id = container.short_id
         self.name = container.name
         self.status = container.status  # running, exited, restarting, etc.
-        self.image = container.image.tags[0] if container.image.tags else "unknown"
-        attrs = container.attrs
-        self.health = "unknown"
-        health_state = attrs.get("State", {}).get("Health", {})
-        if health_state:
-            self.health = health_state.get("Status", "unknown")
-        restart_count = attrs.get("RestartCount", 0)
-        self.restart_count = restart_count
-        self.started_at = attrs.get("State", {}).get("StartedAt", "")
-        self.exit_code = attrs.get("State", {}).get("ExitCode", 0)
-        self.service_name = container.labels.get("com.docker.swarm.service.name", "")
-        self.node_id = container.labels.get("com.docker.swarm.node.id", "")
-        self.task_id = container.labels.get("com.docker.swarm.task.id", "")
+        if image is None:
+            tags = container.image.tags
+            image = tags[0] if tags else "unknown"
+        self.image = image
+        health_state = state.get("Health")
+        self.health = health_state.get("Status", "unknown") if health_state else "unknown"
+        self.restart_count = attrs.get("RestartCount", 0)
+        self.started_at = state.get("StartedAt", "")
+        self.exit_code = state.get("ExitCode", 0)
+        self.service_name = labels.get("com.docker.swarm.service.name", "")
+        self.node_id = labels.get("com.docker.swarm.node.id", "")
+        self.task_id = labels.get("com.docker.swarm.task.id", "")
         self.timestamp = time.time()
 
     def to_dict(self) -> dict:
@@ -90,11 +103,23 @@ class HealthMonitor:
 
     STACK_LABEL = "com.docker.stack.namespace"
 
+    # Concurrent container inspects during a full pass
+    INSPECT_WORKERS = 8
+
+    # Container event actions that can change what check_all() would report;
+    # health events arrive as "health_status: <status>"
+    WATCHED_ACTIONS = frozenset({"start", "restart", "die", "oom", "kill", "stop", "destroy",
+                                 "health_status"})
+
+    # Wakes the loop on stop()
+    _STOP = ("", "")
+
     def __init__(self, stack_name: str = "healstack", check_interval: float = 3.0,
-                 service_ports: Dict[str, int] = None):
+                 service_ports: Dict[str, int] = None, resync_interval: float = 60.0):
         self.client = docker.from_env()
         self.stack_name = stack_name
         self.check_interval = check_interval
+        self.resync_interval = resync_interval
         self.service_ports = service_ports or {
             "healstack_api-gateway": 9001,
             "healstack_auth-service": 9002,
@@ -102,10 +127,33 @@ class HealthMonitor:
         }
         self._callbacks: List[Callable[[FailureEvent], None]] = []
         self.container_states: Dict[str, ContainerState] = {}
+        # (states dict, its to_dict() list); writers replace container_states
+        # rather than mutate it, so identity tells when the view is stale
+        self._states_view: Tuple[Optional[Dict], List[Dict]] = (None, [])
         self.failure_history: List[FailureEvent] = []
         self._active_failures: Dict[str, FailureEvent] = {}
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self._listener: Optional[threading.Thread] = None
+        self._event_stream = None
+        # (container_id, container_name) pairs from the event stream
+        self._event_q: "queue.Queue[Tuple[str, str]]" = queue.Queue()
+        # First tag per image id; images are immutable, so this never goes stale
+        self._image_tags: Dict[str, str] = {}
+        self._pools_open = False
+        self._open_pools()
+
+    def _open_pools(self):
+        """(Re)create the worker pools; stop() shuts them down, start() reopens."""
+        # Probes for the HTTP health checks run concurrently on this pool
+        self._probe_pool = ThreadPoolExecutor(
+            max_workers=max(1, min(32, len(self.service_ports))),
+            thread_name_prefix="http-probe",
+        )
+        self._inspect_pool = ThreadPoolExecutor(
+            max_workers=self.INSPECT_WORKERS, thread_name_prefix="inspect",
+        )
+        self._pools_open = True
 
     def on_failure(self, callback: Callable[[FailureEvent], None]):
         self._callbacks.append(callback)
@@ -123,17 +171,39 @@ class HealthMonitor:
                 pass
 
     def get_containers(self) -> List:
-        """Get relevant containers belonging to our stack."""
+        """
+        Get relevant containers belonging to our stack.
+
+        One list call finds them; the inspects that supply health and
+        restart count (absent from the list response) then run
+        concurrently rather than one round-trip after another.
+        """
         try:
             # We use all=True to see failed containers for diagnosis,
             # but we will filter the state cache to stay clean.
-            return self.client.containers.list(
+            summaries = self.client.api.containers(
                 all=True,
-                filters={"label": f"{self.STACK_LABEL}={self.stack_name}"}
+                filters={"label": f"{self.STACK_LABEL}={self.stack_name}"},
             )
+            inspected = self._inspect_pool.map(self._inspect, [c["Id"] for c in summaries])
+            return [c for c in inspected if c is not None]
         except Exception:
             return []
 
+    def _inspect(self, container_id: str):
+        try:
+            return self.client.containers.get(container_id)
+        except docker.errors.NotFound:
+            return None  # Removed since the list call
+
+    def _image_tag(self, container) -> str:
+        image_id = container.attrs.get("ImageID") or container.attrs.get("Image", "")
+        tag = self._image_tags.get(image_id)
+        if tag is None:
+            tags = container.image.tags
+            tag = self._image_tags[image_id] = tags[0] if tags else "unknown"
+        return tag
+
     def check_all(self) -> List[FailureEvent]:
         """Run all health checks and return new failures."""
         events = []
@@ -144,12 +214,7 @@ class HealthMonitor:
 
         for container in containers:
             try:
-                container.reload()
-                state = ContainerState(container)
-                
-                # Only keep running or very recently exited containers (non-zero exit)
-                if state.status == "running" or state.exit_code != 0:
-                    new_states[state.name] = state
+                self._track(ContainerState(container, image=self._image_tag(container)), new_states)
             except Exception:
                 continue
                 
@@ -158,64 +223,117 @@ class HealthMonitor:
         # Process failures for each tracked container
         for state in self.container_states.values():
             try:
-                # Auto-resolve active failures if container is running healthy
-                if state.status == "running" and state.health in ("healthy", "unknown"):
-                    for ftype in ("ContainerCrash", "Unhealthy", "CrashLoop"):
-                        key = f"{state.service_name}:{ftype}"
-                        if key in self._active_failures and not self._active_failures[key].resolved:
-                            self._active_failures[key].resolved = True
-
-                # Check 1: Container crashed / exited
-                if state.status == "exited" and state.exit_code != 0:
-                    ev = FailureEvent(
-                        "ContainerCrash", state.name, state.service_name,
-                        f"Container '{state.name}' exited with code {state.exit_code}",
-                        "Critical",
-                        {"exit_code": state.exit_code, "restart_count": state.restart_count}
-                    )
-                    events.append(ev)
-                    self._emit(ev)
-
-                # Check 2: Unhealthy health check
-                elif state.health == "unhealthy":
-                    ev = FailureEvent(
-                        "Unhealthy", state.name, state.service_name,
-                        f"Container '{state.name}' health check failing",
-                        "Warning",
-                        {"health": state.health, "restart_count": state.restart_count}
-                    )
-                    events.append(ev)
-                    self._emit(ev)
-
-                # Check 3: High restart count
-                elif state.restart_count > 3:
-                    ev = FailureEvent(
-                        "CrashLoop", state.name, state.service_name,
-                        f"Container '{state.name}' restarting excessively ({state.restart_count} restarts)",
-                        "Critical",
-                        {"restart_count": state.restart_count}
-                    )
-                    events.append(ev)
-                    self._emit(ev)
+                ev = self._check_container(state)
             except Exception:
                 continue
+            if ev:
+                events.append(ev)
 
         # Check 4: HTTP health check on service ports
         events.extend(self._check_http_health())
 
         return events
 
+    def _check_container(self, state: ContainerState) -> Optional[FailureEvent]:
+        """Run the container-level checks on one state; returns its failure, if any."""
+        # Auto-resolve active failures if container is running healthy
+        if state.status == "running" and state.health in ("healthy", "unknown"):
+            for ftype in ("ContainerCrash", "Unhealthy", "CrashLoop"):
+                key = f"{state.service_name}:{ftype}"
+                if key in self._active_failures and not self._active_failures[key].resolved:
+                    self._active_failures[key].resolved = True
+
+        # Check 1: Container crashed / exited
+        if state.status == "exited" and state.exit_code != 0:
+            ev = FailureEvent(
+                "ContainerCrash", state.name, state.service_name,
+                f"Container '{state.name}' exited with code {state.exit_code}",
+                "Critical",
+                {"exit_code": state.exit_code, "restart_count": state.restart_count}
+            )
+            self._emit(ev)
+            return ev
+
+        # Check 2: Unhealthy health check
+        elif state.health == "unhealthy":
+            ev = FailureEvent(
+                "Unhealthy", state.name, state.service_name,
+                f"Container '{state.name}' health check failing",
+                "Warning",
+                {"health": state.health, "restart_count": state.restart_count}
+            )
+            self._emit(ev)
+            return ev
+
+        # Check 3: High restart count
+        elif state.restart_count > 3:
+            ev = FailureEvent(
+                "CrashLoop", state.name, state.service_name,
+                f"Container '{state.name}' restarting excessively ({state.restart_count} restarts)",
+                "Critical",
+                {"restart_count": state.restart_count}
+            )
+            self._emit(ev)
+            return ev
+        return None
+
+    def _track(self, state: ContainerState, states: Dict[str, ContainerState]) -> bool:
+        """Keep only running or very recently exited containers (non-zero exit)."""
+        if state.status == "running" or state.exit_code != 0:
+            states[state.name] = state
+            return True
+        states.pop(state.name, None)
+        return False
+
+    def refresh_container(self, container_id: str, name: str = "") -> Optional[FailureEvent]:
+        """
+        Re-inspect a single container after an event and run its checks.
+        The state table is replaced, not mutated, so readers never see it
+        change mid-iteration.
+        """
+        states = dict(self.container_states)
+        try:
+            container = self.client.containers.get(container_id)
+        except docker.errors.NotFound:
+            states.pop(name, None)
+            self.container_states = states
+            return None
+        state = ContainerState(container, image=self._image_tag(container))
+        if state.name != name:
+            states.pop(name, None)
+        tracked = self._track(state, states)
+        self.container_states = states
+        return self._check_container(state) if tracked else None
+
+    @staticmethod
+    def _probe(port: int) -> Tuple[Optional[Dict], Optional[Exception]]:
+        """GET one service's /health; returns (payload, None) or (None, error)."""
+        try:
+            req = urllib.request.Request(
+                f"http://localhost:{port}/health",
+                headers={"User-Agent": "HealthMonitor/1.0"}
+            )
+            with urllib.request.urlopen(req, timeout=3) as resp:
+                return json.loads(resp.read()), None
+        except Exception as e:
+            return None, e
+
     def _check_http_health(self) -> List[FailureEvent]:
-        """Check actual HTTP /health endpoints."""
+        """
+        Check actual HTTP /health endpoints. All services are probed at
+        once, so a cycle waits for the slowest probe (at most the 3s
+        timeout) rather than the sum; events are emitted in service order.
+        """
         events = []
-        for svc_name, port in self.service_ports.items():
+        services = list(self.service_ports.items())
+        try:
+            results = self._probe_pool.map(self._probe, [port for _, port in services])
+        except RuntimeError:
+            return events  # stop() shut the pool down mid-cycle
+        for (svc_name, port), (data, error) in zip(services, results):
             try:
-                req = urllib.request.Request(
-                    f"http://localhost:{port}/health",
-                    headers={"User-Agent": "HealthMonitor/1.0"}
-                )
-                resp = urllib.request.urlopen(req, timeout=3)
-                data = json.loads(resp.read())
+                if error is not None:
+                    raise error
                 if data.get("status") != "healthy":
                     ev = FailureEvent(
                         "ServiceUnhealthy", svc_name, svc_name,
@@ -243,20 +361,85 @@ class HealthMonitor:
 
     # Background runner
     def start(self):
+        if not self._pools_open:
+            self._open_pools()  # Restarted after stop()
         self._running = True
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
+        self._listener = threading.Thread(target=self._listen, daemon=True)
+        self._listener.start()
 
     def stop(self):
         self._running = False
+        stream = self._event_stream
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+        self._event_q.put(self._STOP)
+        # Idle workers would otherwise outlive the monitor
+        if self._pools_open:
+            self._pools_open = False
+            self._probe_pool.shutdown(wait=False)
+            self._inspect_pool.shutdown(wait=False)
+
+    def _listen(self):
+        """Forward our stack's container events to the run loop, reconnecting on errors."""
+        filters = {"type": "container", "label": f"{self.STACK_LABEL}={self.stack_name}"}
+        while self._running:
+            try:
+                self._event_stream = self.client.events(decode=True, filters=filters)
+                for event in self._event_stream:
+                    if not self._running:
+                        break
+                    action = (event.get("Action") or event.get("status") or "").split(":")[0]
+                    if action not in self.WATCHED_ACTIONS:
+                        continue
+                    actor = event.get("Actor") or {}
+                    container_id = actor.get("ID") or event.get("id", "")
+                    name = (actor.get("Attributes") or {}).get("name", "")
+                    if container_id:
+                        self._event_q.put((container_id, name))
+            except Exception:
+                pass
+            if self._running:
+                # Stream dropped; the resync pass covers the gap until reconnect
+                time.sleep(self.check_interval)
 
     def _run(self):
+        now = time.monotonic()
+        next_resync, next_http = now, now + self.check_interval
         while self._running:
-            self.check_all()
-            time.sleep(self.check_interval)
+            now = time.monotonic()
+            if now >= next_resync:
+                # Full pass catches anything the event stream missed
+                self.check_all()
+                next_resync = now + self.resync_interval
+                next_http = now + self.check_interval
+                continue
+            if now >= next_http:
+                self._check_http_health()
+                next_http = now + self.check_interval
+                continue
+            try:
+                container_id, name = self._event_q.get(timeout=min(next_resync, next_http) - now)
+            except queue.Empty:
+                continue
+            if container_id:
+                try:
+                    self.refresh_container(container_id, name)
+                except Exception:
+                    pass
 
     def get_all_states(self) -> List[Dict]:
-        return [s.to_dict() for s in self.container_states.values()]
+        """State dicts are shared between calls until the next update; read-only."""
+        states = self.container_states
+        owner, view = self._states_view
+        if owner is not states:
+            view = [s.to_dict() for s in states.values()]
+            self._states_view = (states, view)
+        return list(view)
 
     def get_active_failures(self) -> List[Dict]:
         return [e.to_dict() for e in self._active_failures.values() if not e.resolved]
@@ -8,8 +8,11 @@ Never forwards traffic to an unhealthy pod.
 Reroutes instantly when a pod or service fails.
 """
 
+import sys
 import time
-from typing import List, Dict, Optional
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Deque
 from controller.cluster import Cluster, Service, Pod, PodStatus
 
 
@@ -17,7 +20,8 @@ class ProxyRequest:
     """A simulated incoming traffic request."""
 
     def __init__(self, service_name: str, client_id: str = "client", payload: str = ""):
-        self.service_name = service_name
+        # Interned so per-service table lookups hit on identity
+        self.service_name = sys.intern(service_name)
         self.client_id = client_id
         self.payload = payload
         self.timestamp = time.time()
@@ -55,18 +59,74 @@ class ProxyResponse:
         }
 
 
+@dataclass
+class LogEntry:
+    """One routed request in the proxy's request log."""
+
+    # Written out by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        "service", "client", "success", "target_pod", "latency_ms",
+        "rerouted", "timestamp",
+    )
+
+    service: str
+    client: str
+    success: bool
+    target_pod: Optional[str]
+    latency_ms: float
+    rerouted: bool
+    timestamp: float
+
+
 class ProxyServer:
     """
     Health-aware reverse proxy.
 
     Routes traffic only to healthy service endpoints.
     Tracks request metrics per service.
+
+    Each service's candidate pods (selector matches, in all_pods() order)
+    are cached, so a request filters a handful of pods instead of the
+    whole cluster. The cache is dropped whenever pod membership or
+    placement changes: pod-table adds/removes and relabels, or any
+    Node/Service change notification. Health is still checked per request.
+    Call close() when discarding a proxy to stop watching the cluster.
     """
 
     def __init__(self, cluster: Cluster):
         self.cluster = cluster
-        self.request_log: List[Dict] = []
+        # Last 1000 requests; appends evict the oldest in O(1)
+        self.request_log: Deque[LogEntry] = deque(maxlen=1000)
         self.service_stats: Dict[str, Dict] = {}
+        self._svc_index: Dict[str, List[Pod]] = {}
+        self._index_key: Optional[tuple] = None
+        self._topology_changes = 0
+        cluster.subscribe(self._on_cluster_change)
+
+    def _on_cluster_change(self, resource_type: str, resource):
+        # Pod notifications are state changes only; health is checked per request
+        if resource_type != "Pod":
+            self._topology_changes += 1
+
+    def close(self):
+        """Stop receiving cluster change notifications."""
+        self.cluster.unsubscribe(self._on_cluster_change)
+
+    def invalidate(self):
+        """Drop the per-service endpoint cache."""
+        self._index_key = None
+
+    def _candidates(self, svc: Service) -> List[Pod]:
+        table = self.cluster.pod_table
+        key = (table, table.version, self._topology_changes)
+        if key != self._index_key:
+            self._svc_index = {}
+            self._index_key = key
+        pods = self._svc_index.get(svc.name)
+        if pods is None:
+            pods = [p for p in self.cluster.all_pods() if svc.selects(p)]
+            self._svc_index[svc.name] = pods
+        return pods
 
     def route_request(self, req: ProxyRequest) -> ProxyResponse:
         """Route a request to a healthy pod via the service."""
@@ -80,7 +140,7 @@ class ProxyServer:
             return resp
 
         # Get a healthy pod via round-robin
-        target = svc.route_request(self.cluster.all_pods())
+        target = svc.route_request(self._candidates(svc))
         if not target:
             resp = ProxyResponse(
                 success=False,
@@ -113,32 +173,25 @@ class ProxyServer:
         return results
 
     def _log(self, req: ProxyRequest, resp: ProxyResponse):
-        entry = {
-            "service": req.service_name,
-            "client": req.client_id,
-            "success": resp.success,
-            "target_pod": resp.target_pod,
-            "latency_ms": resp.latency_ms,
-            "rerouted": resp.rerouted,
-            "timestamp": resp.timestamp,
-        }
-        self.request_log.append(entry)
-        # Keep last 1000 entries
-        if len(self.request_log) > 1000:
-            self.request_log = self.request_log[-1000:]
-
-        # Update service stats
-        svc = req.service_name
-        if svc not in self.service_stats:
-            self.service_stats[svc] = {"total": 0, "success": 0, "failed": 0, "rerouted": 0, "total_latency": 0.0}
-        self.service_stats[svc]["total"] += 1
+        self.request_log.append(LogEntry(
+            req.service_name, req.client_id, resp.success, resp.target_pod,
+            resp.latency_ms, resp.rerouted, resp.timestamp,
+        ))
+
+        # Update service stats (one lookup, then work on the row dict)
+        stats = self.service_stats.get(req.service_name)
+        if stats is None:
+            stats = self.service_stats[req.service_name] = {
+                "total": 0, "success": 0, "failed": 0, "rerouted": 0, "total_latency": 0.0,
+            }
+        stats["total"] += 1
         if resp.success:
-            self.service_stats[svc]["success"] += 1
-            self.service_stats[svc]["total_latency"] += resp.latency_ms
+            stats["success"] += 1
+            stats["total_latency"] += resp.latency_ms
         else:
-            self.service_stats[svc]["failed"] += 1
+            stats["failed"] += 1
         if resp.rerouted:
-            self.service_stats[svc]["rerouted"] += 1
+            stats["rerouted"] += 1
 
     def get_service_stats(self, service_name: str) -> Dict:
         stats = self.service_stats.get(service_name, {})
@@ -54,9 +54,7 @@ class DisasterRestore:
         t0 = time.time()
 
         # ── Step 1: Wipe current state ───────────────────────────
-        cluster.nodes.clear()
-        cluster.deployments.clear()
-        cluster.services.clear()
+        cluster.clear()
         cluster._log_event("DisasterRestore", "Wiping current cluster state", "Critical")
 
         # ── Step 2: Rebuild nodes ────────────────────────────────
@@ -98,14 +98,8 @@ class RecoveryEngine:
         if not dep:
             return
 
-        # Remove the old pod from its node
-        if failed_pod.node_name:
-            node = self.cluster.get_node(failed_pod.node_name)
-            if node:
-                node.remove_pod(failed_pod.name)
-
-        # Remove from deployment's pod list
-        dep.pods = [p for p in dep.pods if p.name != failed_pod.name]
+        # Remove the old pod from its node and deployment
+        self.cluster.delete_pod(failed_pod)
 
         # Create a replacement
         new_idx = len(dep.pods)
@@ -19,15 +19,18 @@ no central coordinators, no routing tables.
 All routing is LOCAL and GREEDY.
 """
 
+import math
+from operator import itemgetter, mul, sub
 from typing import Optional, List, Tuple
 
 from avrs.math_utils import (
     Vector,
     cosine_similarity,
     euclidean_distance,
+    magnitude,
     vector_subtract,
 )
-from avrs.node import Node
+from avrs.node import Node, route_key
 from topology_engine import face_route_full
 
 
@@ -88,36 +91,89 @@ class RoutingEngine:
 
         score = 0.5*cosine + 0.3*distance_gain - 0.15*load + 0.05*trust
         """
-        direction_to_target = vector_subtract(target, list(current.vector))
-        direction_to_neighbor = vector_subtract(list(neighbor.vector), list(current.vector))
+        cv = current.vector
+        direction_to_target = vector_subtract(target, cv)
+        score, _ = self._score_one(
+            neighbor, cv, target, direction_to_target,
+            magnitude(direction_to_target), euclidean_distance(cv, target),
+        )
+        return score
 
-        cosine = cosine_similarity(direction_to_target, direction_to_neighbor)
+    def _score_one(
+        self,
+        neighbor: Node,
+        cv: Vector,
+        target: Vector,
+        direction_to_target: Vector,
+        mag_target: float,
+        dist_current: float,
+    ) -> Tuple[float, float]:
+        """
+        The Section 5 formula for one neighbor, given the per-hop terms
+        (C, T − C, its norm, dist(C,T)). Returns (score, dist(N,T)).
+        score_neighbor and _score_with_distances both go through here, so
+        there is one copy of the weights and the formula.
 
-        dist_current = euclidean_distance(list(current.vector), target)
-        dist_neighbor = euclidean_distance(list(neighbor.vector), target)
-        distance_gain = dist_current - dist_neighbor
+        The math_utils helpers are inlined (same operations, same order,
+        so scores are bit-identical to calling them).
+        """
+        nv = neighbor.vector
+        direction_to_neighbor = list(map(sub, nv, cv))
+        mag_neighbor = math.hypot(*direction_to_neighbor)
+        if mag_target == 0.0 or mag_neighbor == 0.0:
+            cosine = 0.0
+        else:
+            cosine = sum(map(mul, direction_to_target, direction_to_neighbor)) / (
+                mag_target * mag_neighbor
+            )
+        dist_neighbor = math.dist(nv, target)
 
         # Normalize load to [0,1] range (cap at 20)
-        normalized_load = min(neighbor.load / 20.0, 1.0) if neighbor.load > 0 else 0.0
+        load = neighbor.load
+        normalized_load = min(load / 20.0, 1.0) if load > 0 else 0.0
 
         score = (
             self.alpha * cosine
-            + self.beta * distance_gain
+            + self.beta * (dist_current - dist_neighbor)
             - self.gamma * normalized_load
             + self.delta * neighbor.trust
         )
-        return score
+        return score, dist_neighbor
 
     def score_all_neighbors(
         self, current: Node, target: Vector
     ) -> List[Tuple[Node, float]]:
         """Score all alive neighbors and return sorted list (best first)."""
-        alive_neighbors = current.get_alive_neighbors()
+        return [(nb, s) for nb, s, _ in self._score_with_distances(current, target)]
+
+    def _score_with_distances(
+        self, current: Node, target: Vector
+    ) -> List[Tuple[Node, float, float]]:
+        """
+        (neighbor, score, distance_to_target) for every alive neighbor,
+        best score first. Same scores as score_neighbor, but the terms
+        that depend only on the current node (T − C, its norm, dist(C,T))
+        are computed once per hop instead of once per neighbor, and each
+        neighbor's distance is kept for the caller.
+
+        dist_current goes through euclidean_distance, so a dimension
+        mismatch raises as before.
+        """
+        cv = current.vector
+        direction_to_target = vector_subtract(target, cv)
+        mag_target = magnitude(direction_to_target)
+        dist_current = euclidean_distance(cv, target)
+        score_one = self._score_one
+
         scored = []
-        for neighbor in alive_neighbors:
-            s = self.score_neighbor(current, neighbor, target)
-            scored.append((neighbor, s))
-        scored.sort(key=lambda x: x[1], reverse=True)
+        for neighbor in current.neighbors:
+            if not neighbor.alive:
+                continue
+            score, dist_neighbor = score_one(
+                neighbor, cv, target, direction_to_target, mag_target, dist_current,
+            )
+            scored.append((neighbor, score, dist_neighbor))
+        scored.sort(key=itemgetter(1), reverse=True)
         return scored
 
     # ── Termination Check (Section 13) ────────────────────────────
@@ -131,13 +187,13 @@ class RoutingEngine:
           1. Current node is closest (local minimum)
           2. Cosine similarity > 0.99
         """
-        current_dist = euclidean_distance(list(current.vector), target)
+        current_dist = euclidean_distance(current.vector, target)
 
         # Condition 1: local minimum (no alive neighbor is closer)
         alive_neighbors = current.get_alive_neighbors()
         if alive_neighbors:
             all_farther = all(
-                euclidean_distance(list(n.vector), target) >= current_dist - 1e-10
+                euclidean_distance(n.vector, target) >= current_dist - 1e-10
                 for n in alive_neighbors
             )
             if all_farther:
@@ -148,7 +204,7 @@ class RoutingEngine:
             return "no_neighbors"
 
         # Condition 2: high cosine similarity
-        cos = cosine_similarity(list(current.vector), target)
+        cos = cosine_similarity(current.vector, target)
         if cos > self.cosine_threshold:
             return "high_similarity"
 
@@ -176,7 +232,7 @@ class RoutingEngine:
 
         # Check cache first (Section 14)
         if self.use_cache:
-            target_key = tuple(round(v, 4) for v in target)
+            target_key = route_key(target)
             cached_id = current.get_cached_route(target_key)
             if cached_id is not None:
                 for n in current.get_alive_neighbors():
@@ -184,11 +240,10 @@ class RoutingEngine:
                         return n, "cache", []
 
         # Score all alive neighbors
-        scored = self.score_all_neighbors(current, target)
-        dist_current = euclidean_distance(list(current.vector), target)
+        scored = self._score_with_distances(current, target)
+        dist_current = euclidean_distance(current.vector, target)
 
-        for neighbor, score in scored:
-            dist_nb = euclidean_distance(list(neighbor.vector), target)
+        for neighbor, score, dist_nb in scored:
             improves = dist_nb < dist_current - 1e-10
             score_details.append({
                 "neighbor": neighbor.id,
@@ -201,14 +256,13 @@ class RoutingEngine:
             })
 
         # Try greedy: best scoring neighbor that hasn't been visited
-        for neighbor, score in scored:
+        for neighbor, score, dist_nb in scored:
             if neighbor.id not in visited:
-                dist_nb = euclidean_distance(list(neighbor.vector), target)
                 if dist_nb < dist_current - 1e-10:
                     return neighbor, "greedy", score_details
 
         # Fallback (Section 7): try next best even if doesn't strictly improve distance
-        for neighbor, score in scored:
+        for neighbor, score, _ in scored:
             if neighbor.id not in visited:
                 return neighbor, "fallback", score_details
 
@@ -84,7 +84,7 @@ def score_candidate(
 
     Lower load -> higher score.
     """
-    dist = euclidean_distance(list(node.vector), target_vector)
+    dist = euclidean_distance(node.vector, target_vector)
     max_dist = 4.0  # max possible in 4D-unit space
     norm_dist = min(dist / max_dist, 1.0)
     norm_load = min(node.load / max(max_load_normalizer, 1), 1.0)
@@ -383,7 +383,7 @@ def build_semantic_network(
         for other in nodes:
             if other is n:
                 continue
-            d = euclidean_distance(list(n.vector), list(other.vector))
+            d = euclidean_distance(n.vector, other.vector)
             dists.append((d, other))
         dists.sort(key=lambda x: x[0])
         for _, nb in dists[:k]:
@@ -350,10 +350,12 @@ def init_system():
     global monitor, log_collector, ai_analyzer, recovery_engine, deployer, docker_client
 
     docker_client = docker.from_env()
-    log_collector = LogCollector()
+    log_collector = LogCollector(client=docker_client)
     ai_analyzer = AIAnalyzer()
     recovery_engine = RecoveryEngine()
-    deployer = BlueGreenDeployer(event_callback=lambda t, d: push_event(t, d))
+    deployer = BlueGreenDeployer(
+        event_callback=lambda t, state: push_event(t, state.to_dict()), client=docker_client,
+    )
 
     monitor = HealthMonitor(stack_name="healstack", check_interval=5.0)
     monitor.on_failure(on_failure_detected)
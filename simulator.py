@@ -15,8 +15,10 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 import time
 
+import numpy as np
+
 from avrs.math_utils import Vector, euclidean_distance, cosine_similarity
-from avrs.node import Node
+from avrs.node import Node, route_key
 from routing_engine import RoutingEngine
 
 
@@ -97,6 +99,12 @@ class Simulator:
         self.engine = engine or RoutingEngine()
         self.verbose = verbose
         self._results: List[RouteResult] = []
+        # (N, D) matrix of node vectors, and a copy of the node list it
+        # was built from. Node has no __eq__, so comparing the lists checks
+        # element identity (in C); any node added, removed, or replaced in
+        # place, or a new list, forces a rebuild
+        self._points: Optional[np.ndarray] = None
+        self._points_nodes: Optional[List[Node]] = None
 
     def get_node(self, node_id: str) -> Optional[Node]:
         """Lookup node by ID."""
@@ -106,20 +114,44 @@ class Simulator:
         return None
 
     def find_closest_node(self, target: Vector) -> Optional[Node]:
-        """Find the alive node closest to the target."""
-        best = None
-        best_dist = float('inf')
-        for node in self.nodes:
-            if not node.alive:
-                continue
-            d = euclidean_distance(list(node.vector), target)
-            if d < best_dist:
-                best_dist = d
-                best = node
-        return best
+        """Find the alive node closest to the target (first one on ties)."""
+        return self.find_closest_nodes([target])[0]
+
+    def find_closest_nodes(self, targets: List[Vector]) -> List[Optional[Node]]:
+        """find_closest_node for several targets in one (B, N) distance pass."""
+        nodes = self.nodes
+        if not nodes or not len(targets):
+            return [None] * len(targets)
+        if nodes != self._points_nodes:
+            self._points = np.array([n.vector for n in nodes], dtype=np.float64)
+            self._points_nodes = list(nodes)
+        alive = np.fromiter((n.alive for n in nodes), dtype=bool, count=len(nodes))
+        if not alive.any():
+            return [None] * len(targets)
+        diff = self._points[None, :, :] - np.asarray(targets, dtype=np.float64)[:, None, :]
+        dist = np.einsum("bij,bij->bi", diff, diff)
+        dist[:, ~alive] = np.inf
+        return [nodes[i] for i in np.argmin(dist, axis=1).tolist()]
 
     # ── Route Execution ───────────────────────────────────────────
 
+    def route_requests(
+        self,
+        starts: List[Node],
+        requests: List[Request],
+    ) -> List[RouteResult]:
+        """
+        Route a batch of (start, request) pairs. The closest node to every
+        target is found in one vectorized pass up front; the routes then
+        run in order, since each one's load updates feed into the scoring
+        of the next.
+        """
+        closest = self.find_closest_nodes([r.target_vector for r in requests])
+        return [
+            self._route(start, request, closest_node)
+            for start, request, closest_node in zip(starts, requests, closest)
+        ]
+
     def route_request(
         self,
         start: Node,
@@ -133,9 +165,16 @@ class Simulator:
           - No packet cycling (visited set)
           - Finite termination guaranteed
         """
+        return self._route(start, request, self.find_closest_node(request.target_vector))
+
+    def _route(
+        self,
+        start: Node,
+        request: Request,
+        closest_node: Optional[Node],
+    ) -> RouteResult:
         target = request.target_vector
-        closest_node = self.find_closest_node(target)
-        optimal_dist = euclidean_distance(list(closest_node.vector), target) if closest_node else float('inf')
+        optimal_dist = euclidean_distance(closest_node.vector, target) if closest_node else float('inf')
 
         result = RouteResult(
             request=request,
@@ -154,7 +193,7 @@ class Simulator:
             result.path.append(current.id)
             visited.add(current.id)
 
-            dist = euclidean_distance(list(current.vector), target)
+            dist = euclidean_distance(current.vector, target)
 
             # Increment load on current node (Section 9)
             current.increment_load()
@@ -214,7 +253,7 @@ class Simulator:
 
             # Cache route (Section 14)
             if self.engine.use_cache:
-                target_key = tuple(round(v, 4) for v in target)
+                target_key = route_key(target)
                 current.cache_route(target_key, next_node.id)
 
             # Forward
@@ -225,7 +264,7 @@ class Simulator:
             result.success = False
             result.final_node_id = current.id
             result.total_hops = self.engine.max_hops
-            result.final_distance = euclidean_distance(list(current.vector), target)
+            result.final_distance = euclidean_distance(current.vector, target)
 
         self._results.append(result)
         return result
@@ -27,9 +27,9 @@ from avrs.math_utils import (
 from graph_builder import (
     generate_nodes, build_knn_graph, build_delaunay_graph,
     validate_graph, graph_diagnostics, heal_around_failure,
-    insert_node, remove_node, rebuild_topology,
+    insert_node, remove_node, rebuild_topology, DisjointSet,
 )
-from topology_engine import greedy_guarantee_check, face_route_full
+from topology_engine import greedy_guarantee_check, greedy_guarantee_check_batch, face_route_full
 from routing_engine import RoutingEngine
 from simulator import Simulator, Request
 
@@ -543,6 +543,20 @@ def test_graph_diagnostics():
     assert 0 <= diag["clustering_coefficient"] <= 1, "Invalid clustering coefficient"
 
 
+def test_union_find_components():
+    """Incremental union-find agrees with the full component scan."""
+    nodes, _ = make_network(n=30, seed=42, mode="knn")
+    dsu = DisjointSet.from_nodes(nodes)
+    assert dsu.component_count() == graph_diagnostics(nodes)["component_count"]
+    new = Node(node_id="N999", vector=[0.1, 0.2, 0.3, 0.4])
+    insert_node(new, nodes, k=3, components=dsu)
+    assert dsu.component_count() == graph_diagnostics(nodes)["component_count"]
+    assert dsu.connected(new.id, nodes[0].id)
+    remove_node(nodes[5], nodes)
+    dsu = DisjointSet.from_nodes(nodes)
+    assert dsu.component_count() == graph_diagnostics(nodes)["component_count"]
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  TOPOLOGY ENGINE TESTS
 # ═══════════════════════════════════════════════════════════════════
@@ -560,6 +574,17 @@ def test_greedy_guarantee():
     assert violations_total < 10, f"Too many greedy violations: {violations_total}"
 
 
+def test_greedy_guarantee_batch():
+    """Batched greedy check must match the per-target check, dead nodes included."""
+    nodes, mode = make_network(n=30, seed=7, mode="knn")
+    for node in nodes[::5]:
+        node.alive = False
+    rng = random.Random(7)
+    targets = [[rng.uniform(-1, 1) for _ in range(4)] for _ in range(10)]
+    expected = [greedy_guarantee_check(nodes, t) for t in targets]
+    assert greedy_guarantee_check_batch(nodes, targets) == expected
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  RUNNER
 # ═══════════════════════════════════════════════════════════════════
@@ -606,6 +631,8 @@ def run_all_tests():
     run_test("24. Graph Validation", test_graph_validation)
     run_test("25. Graph Diagnostics", test_graph_diagnostics)
     run_test("26. Greedy Guarantee Check", test_greedy_guarantee)
+    run_test("27. Union-Find Components", test_union_find_components)
+    run_test("28. Greedy Guarantee Batch", test_greedy_guarantee_batch)
 
     # Summary
     passed = sum(1 for _, ok, _ in _results if ok)
@@ -27,6 +27,7 @@ from avrs.node import Node
 from avrs.network import Network
 from avrs.routing import RoutingEngine
 from avrs.simulation import Simulation, Request
+from avrs.vector_embedding import VectorEmbedder
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -294,5 +295,32 @@ class TestSimulation(unittest.TestCase):
         self.assertIn("N000", formatted)
 
 
+# ═══════════════════════════════════════════════════════════════════
+#  VECTOR EMBEDDING TESTS
+# ═══════════════════════════════════════════════════════════════════
+
+class TestVectorEmbedding(unittest.TestCase):
+    """Tests for the embedder's quantized similarity path."""
+
+    def setUp(self):
+        self.embedder = VectorEmbedder(dimensions=64)
+
+    def test_quantized_similarity_matches_cosine(self):
+        """int8 batch similarity should track exact cosine closely."""
+        roles = ["auth", "database", "compute", "storage", "proxy"]
+        nodes = [self.embedder.embed_service_description(r) for r in roles]
+        req = self.embedder.embed_request("login user")
+        approx = self.embedder.compute_similarity_batch(self.embedder.quantize(nodes), req)
+        for vec, sim in zip(nodes, approx):
+            self.assertAlmostEqual(sim, cosine_similarity(vec, req), delta=0.02)
+
+    def test_quantize_zero_vector(self):
+        """A zero vector should quantize to zeros and score 0 similarity."""
+        q = self.embedder.quantize([0.0] * 64)
+        self.assertFalse(q.any())
+        sims = self.embedder.compute_similarity_batch([[0.0] * 64], [1.0] * 64)
+        self.assertEqual(sims[0], 0.0)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -11,6 +11,8 @@ Section 8 — Face Routing Mode
 import math
 from typing import List, Optional, Tuple
 
+import numpy as np
+
 from avrs.math_utils import Vector, euclidean_distance, cosine_similarity
 from avrs.node import Node
 
@@ -35,14 +37,14 @@ def greedy_guarantee_check(nodes: List[Node], target: Vector) -> dict:
         if not node.alive:
             continue
         total_checked += 1
-        dist_current = euclidean_distance(list(node.vector), target)
+        dist_current = euclidean_distance(node.vector, target)
 
         # Check if any node in the network is closer
         any_closer_exists = False
         for other in nodes:
             if other.id == node.id or not other.alive:
                 continue
-            if euclidean_distance(list(other.vector), target) < dist_current - 1e-10:
+            if euclidean_distance(other.vector, target) < dist_current - 1e-10:
                 any_closer_exists = True
                 break
 
@@ -53,7 +55,7 @@ def greedy_guarantee_check(nodes: List[Node], target: Vector) -> dict:
         # There IS a closer node somewhere. Check if at least one neighbor is closer.
         neighbor_closer = False
         for nb in node.get_alive_neighbors():
-            if euclidean_distance(list(nb.vector), target) < dist_current - 1e-10:
+            if euclidean_distance(nb.vector, target) < dist_current - 1e-10:
                 neighbor_closer = True
                 break
 
@@ -67,6 +69,61 @@ def greedy_guarantee_check(nodes: List[Node], target: Vector) -> dict:
     }
 
 
+def greedy_guarantee_check_batch(nodes: List[Node], targets) -> List[dict]:
+    """
+    greedy_guarantee_check for many targets at once.
+
+    Node-to-target distances for all T targets are computed as one N x T
+    matrix, so each node is examined once, comparing its neighbors
+    against every target in a single vectorized step.
+
+    Returns:
+        one result dict per target, in the format of greedy_guarantee_check
+    """
+    targets = np.asarray(targets, dtype=float).reshape(len(targets), -1)
+    alive = [node for node in nodes if node.alive]
+    index = {id(node): i for i, node in enumerate(alive)}
+
+    # Neighbors outside `nodes` still count, so give them rows too
+    points = [node.vector for node in alive]
+    neighbor_rows = []
+    for node in alive:
+        rows = []
+        for nb in node.get_alive_neighbors():
+            i = index.get(id(nb))
+            if i is None:
+                i = index[id(nb)] = len(points)
+                points.append(nb.vector)
+            rows.append(i)
+        neighbor_rows.append(rows)
+
+    n = len(alive)
+    dist = np.linalg.norm(
+        np.asarray(points, dtype=float).reshape(len(points), -1)[:, None, :] - targets[None, :, :],
+        axis=2,
+    ) if points else np.empty((0, len(targets)))
+    # A node can never be closer than itself, so comparing against the
+    # minimum over all alive nodes is the same as "any other node closer"
+    closest = dist[:n].min(axis=0) if n else np.full(len(targets), np.inf)
+
+    violated = np.zeros((n, len(targets)), dtype=bool)
+    for i, rows in enumerate(neighbor_rows):
+        limit = dist[i] - 1e-10
+        if rows:
+            violated[i] = (closest < limit) & ~(dist[rows].min(axis=0) < limit)
+        else:
+            violated[i] = closest < limit
+
+    return [
+        {
+            "passed": not violated[:, t].any(),
+            "violations": [alive[i].id for i in np.flatnonzero(violated[:, t])],
+            "total_checked": n,
+        }
+        for t in range(len(targets))
+    ]
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  FACE ROUTING MODE (Section 8)
 # ═══════════════════════════════════════════════════════════════════
@@ -77,9 +134,9 @@ def _angle_to_target(current: Node, neighbor: Node, target: Vector) -> float:
     measured counter-clockwise in a 2D projection (first two coordinates).
     Used for face routing traversal.
     """
-    cx, cy = list(current.vector)[0], list(current.vector)[1] if len(current.vector) > 1 else 0.0
+    cx, cy = current.vector[0], current.vector[1] if len(current.vector) > 1 else 0.0
     tx, ty = target[0], target[1] if len(target) > 1 else 0.0
-    nx, ny = list(neighbor.vector)[0], list(neighbor.vector)[1] if len(neighbor.vector) > 1 else 0.0
+    nx, ny = neighbor.vector[0], neighbor.vector[1] if len(neighbor.vector) > 1 else 0.0
 
     # Angle from current to target
     angle_target = math.atan2(ty - cy, tx - cx)
@@ -136,8 +193,8 @@ def face_route_step(
     else:
         # Right-hand rule: pick next edge CCW from the edge we arrived on
         # Compute angle of arrival edge (from prev to current)
-        cx, cy = list(current.vector)[0], list(current.vector)[1] if len(current.vector) > 1 else 0.0
-        px, py = list(prev_node.vector)[0], list(prev_node.vector)[1] if len(prev_node.vector) > 1 else 0.0
+        cx, cy = current.vector[0], current.vector[1] if len(current.vector) > 1 else 0.0
+        px, py = prev_node.vector[0], prev_node.vector[1] if len(prev_node.vector) > 1 else 0.0
 
         arrival_angle = math.atan2(py - cy, px - cx)
 
@@ -146,7 +203,7 @@ def face_route_step(
         for nb in alive_neighbors:
             if nb.id in visited_in_face and nb.id != prev_node.id:
                 continue
-            nx, ny = list(nb.vector)[0], list(nb.vector)[1] if len(nb.vector) > 1 else 0.0
+            nx, ny = nb.vector[0], nb.vector[1] if len(nb.vector) > 1 else 0.0
             nb_angle = math.atan2(ny - cy, nx - cx)
             relative = (nb_angle - arrival_angle) % (2 * math.pi)
             candidates.append((relative, nb))
@@ -171,7 +228,7 @@ def face_route_full(
     Returns:
         (found_node, path_taken) — found_node is None if face routing fails.
     """
-    dist_start = euclidean_distance(list(start.vector), target)
+    dist_start = euclidean_distance(start.vector, target)
     current = start
     prev = None
     visited_in_face = {start.id}
@@ -187,7 +244,7 @@ def face_route_full(
         visited_in_face.add(next_node.id)
 
         # Check if this node is closer to target than where we started
-        dist_next = euclidean_distance(list(next_node.vector), target)
+        dist_next = euclidean_distance(next_node.vector, target)
         if dist_next < dist_start - 1e-10:
             return next_node, path  # Found a closer node — resume greedy
 